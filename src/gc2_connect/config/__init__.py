@@ -1,17 +1,48 @@
 # ABOUTME: Configuration and settings package for GC2 Connect.
 # ABOUTME: Handles persistent settings storage and application configuration.
-"""Configuration and settings for GC2 Connect."""
-
-from gc2_connect.config.settings import (
-    ConditionsSettings,
-    GC2Settings,
-    GSProSettings,
-    OpenRangeSettings,
-    Settings,
-    UISettings,
-    get_settings_path,
+"""Configuration and settings for GC2 Connect.
+
+The settings models pull in pydantic, so they are resolved on first access
+(PEP 562); importing the package or get_settings_path alone stays cheap.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from gc2_connect.config.settings_path import get_settings_path
+
+if TYPE_CHECKING:
+    from gc2_connect.config.settings import (
+        ConditionsSettings,
+        GC2Settings,
+        GSProSettings,
+        OpenRangeSettings,
+        Settings,
+        UISettings,
+    )
+
+_LAZY_SETTINGS_NAMES = frozenset(
+    {
+        "ConditionsSettings",
+        "GC2Settings",
+        "GSProSettings",
+        "OpenRangeSettings",
+        "Settings",
+        "UISettings",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Import the settings models on first access."""
+    if name in _LAZY_SETTINGS_NAMES:
+        from gc2_connect.config import settings
+
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "ConditionsSettings",
     "GC2Settings",
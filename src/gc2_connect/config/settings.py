@@ -1,19 +1,37 @@
 # ABOUTME: Settings persistence module for GC2 Connect application.
-# ABOUTME: Handles loading, saving, and platform-specific paths for user settings.
+# ABOUTME: Handles loading and saving user settings; the file location lives in settings_path.
 """Settings persistence for GC2 Connect."""
 
 from __future__ import annotations
 
-import json
+import atexit
+import functools
 import logging
-import sys
+import os
+import secrets
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import from_json
+
+from gc2_connect.config.settings_path import get_settings_path
 
 logger = logging.getLogger(__name__)
 
+# How save() makes the file durable: "now" fsyncs before returning, "batch"
+# defers the fsync so a burst of saves shares one.
+SaveSync = Literal["now", "batch"]
+
+# Quiet period after the last batched save before its fsync runs (seconds)
+SAVE_SYNC_DELAY_S: float = 0.02
+
+# Save temp files are new, write-only and binary (O_BINARY exists only on Windows)
+_TEMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
 
 class GSProSettings(BaseModel):
     """Settings for GSPro connection."""
@@ -42,7 +60,12 @@ class UISettings(BaseModel):
 
 
 class ConditionsSettings(BaseModel):
-    """Environmental conditions for Open Range simulation."""
+    """Environmental conditions for Open Range simulation.
+
+    Nested settings models are given ``default_factory`` defaults rather than
+    shared instances, so pydantic builds a fresh leaf model directly instead of
+    deep-copying a default on every parent construction.
+    """
 
     temp_f: Annotated[float, Field(description="Temperature in Fahrenheit")] = 70.0
     elevation_ft: Annotated[float, Field(description="Elevation in feet")] = 0.0
@@ -56,8 +79,8 @@ class ConditionsSettings(BaseModel):
 class OpenRangeSettings(BaseModel):
     """Settings for Open Range driving range simulator."""
 
-    conditions: Annotated[ConditionsSettings, Field(description="Environmental conditions")] = (
-        ConditionsSettings()
+    conditions: ConditionsSettings = Field(
+        default_factory=ConditionsSettings, description="Environmental conditions"
     )
     surface: Annotated[str, Field(description="Ground surface type")] = "Fairway"
     show_trajectory: Annotated[bool, Field(description="Show trajectory line")] = True
@@ -69,18 +92,22 @@ class Settings(BaseModel):
 
     version: Annotated[int, Field(description="Settings schema version")] = 2
     mode: Annotated[str, Field(description="Current app mode (gspro or open_range)")] = "gspro"
-    gspro: Annotated[GSProSettings, Field(description="GSPro settings")] = GSProSettings()
-    gc2: Annotated[GC2Settings, Field(description="GC2 settings")] = GC2Settings()
-    ui: Annotated[UISettings, Field(description="UI settings")] = UISettings()
-    open_range: Annotated[OpenRangeSettings, Field(description="Open Range settings")] = (
-        OpenRangeSettings()
+    gspro: GSProSettings = Field(default_factory=GSProSettings, description="GSPro settings")
+    gc2: GC2Settings = Field(default_factory=GC2Settings, description="GC2 settings")
+    ui: UISettings = Field(default_factory=UISettings, description="UI settings")
+    open_range: OpenRangeSettings = Field(
+        default_factory=OpenRangeSettings, description="Open Range settings"
     )
 
     @classmethod
     def load(cls, path: Path | None = None) -> Settings:
         """Load settings from file, returning defaults if file doesn't exist.
 
-        Handles migration from v1 to v2 automatically.
+        Handles migration from v1 to v2 automatically. A successfully parsed
+        result is cached per file version (mtime, size and inode), so
+        repeated loads of an unchanged file skip parsing and validation;
+        each call still returns its own copy. Failed loads are not cached,
+        so a transient read error is retried on the next load.
 
         Args:
             path: Optional custom path to load from. Uses platform default if None.
@@ -90,20 +117,46 @@ class Settings(BaseModel):
         """
         settings_path = path or get_settings_path()
 
-        if not settings_path.exists():
+        try:
+            stat = settings_path.stat()
+        except FileNotFoundError:
             logger.info(f"Settings file not found at {settings_path}, using defaults")
             return cls()
+        except OSError as e:
+            logger.warning(f"Error loading settings: {e}, using defaults")
+            return cls()
 
+        file_version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
         try:
-            data = json.loads(settings_path.read_text())
-            data = cls._migrate(data)
-            return cls(**data)
-        except json.JSONDecodeError as e:
+            loaded = _load_cached(settings_path, file_version)
+        except ValidationError as e:
+            logger.warning(f"Error loading settings: {e}, using defaults")
+            return cls()
+        except ValueError as e:
             logger.warning(f"Invalid JSON in settings file: {e}, using defaults")
             return cls()
         except Exception as e:
             logger.warning(f"Error loading settings: {e}, using defaults")
             return cls()
+        return loaded.model_copy(deep=True)
+
+    @classmethod
+    def _load_file(cls, settings_path: Path) -> Settings:
+        """Read, migrate and validate a settings file.
+
+        Args:
+            settings_path: Existing settings file to read.
+
+        Returns:
+            Settings instance with the loaded values.
+
+        Raises:
+            OSError: If the file can't be read.
+            ValueError: If the file isn't valid JSON or valid settings.
+        """
+        # pydantic-core's parser reads the raw bytes without a str decode
+        data = from_json(settings_path.read_bytes())
+        return cls.model_validate(cls._migrate(data))
 
     @classmethod
     def _migrate(cls, data: dict[str, Any]) -> dict[str, Any]:
@@ -119,64 +172,219 @@ class Settings(BaseModel):
 
         if version < 2:
             logger.info(f"Migrating settings from v{version} to v2")
-            # Add mode field (default to gspro for existing users)
-            if "mode" not in data:
-                data["mode"] = "gspro"
-            # Add open_range settings with defaults
-            if "open_range" not in data:
-                data["open_range"] = OpenRangeSettings().model_dump()
-            # Update version
-            data["version"] = 2
+            _migrate_v1_to_v2(data)
 
         return data
 
-    def save(self, path: Path | None = None) -> None:
+    def save(self, path: Path | None = None, sync: SaveSync = "batch") -> None:
         """Save settings to file.
 
+        The file is replaced atomically, so readers always see a complete
+        file. With sync="batch" the fsync is deferred until saves have been
+        quiet for SAVE_SYNC_DELAY_S, so rapid UI changes share one fsync;
+        call flush_pending() to force it.
+
         Args:
             path: Optional custom path to save to. Uses platform default if None.
+            sync: "now" to fsync before returning, "batch" to defer it.
         """
         settings_path = path or get_settings_path()
 
-        # Create parent directories if needed
-        settings_path.parent.mkdir(parents=True, exist_ok=True)
-
         try:
-            settings_path.write_text(json.dumps(self.to_dict(), indent=2))
+            # Serialize straight to JSON bytes in pydantic-core: no intermediate
+            # dict for json.dumps to walk, and no str to encode before writing.
+            data = self.__pydantic_serializer__.to_json(self, indent=2)
+            _write_atomic(settings_path, data, fsync=sync == "now")
+            # Timestamps can be coarser than back-to-back saves, so don't rely
+            # on the load cache noticing our own writes.
+            _load_cached.cache_clear()
+            if sync == "now":
+                _fsync_dir(settings_path.parent)
+            else:
+                _pending_sync.schedule(settings_path)
             logger.info(f"Settings saved to {settings_path}")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
             raise
 
+    @staticmethod
+    def flush_pending() -> None:
+        """Fsync any batched saves that have not been synced yet."""
+        _pending_sync.flush()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary for JSON serialization.
 
         Returns:
             Dictionary representation of settings.
         """
-        return {
-            "version": self.version,
-            "mode": self.mode,
-            "gspro": self.gspro.model_dump(),
-            "gc2": self.gc2.model_dump(),
-            "ui": self.ui.model_dump(),
-            "open_range": self.open_range.model_dump(),
-        }
+        # Same output as model_dump(), without its Python-side argument handling
+        data: dict[str, Any] = self.__pydantic_serializer__.to_python(self)
+        return data
 
 
-def get_settings_path() -> Path:
-    """Get the platform-specific settings file path.
+def _migrate_v1_to_v2(data: dict[str, Any]) -> None:
+    """Upgrade raw v1 settings data to v2 in place, before validation.
+
+    A missing open_range section is left for the model's default to fill in
+    during validation rather than being built and dumped here.
+
+    Args:
+        data: Raw v1 settings data from file.
+    """
+    # Existing users keep GSPro mode
+    data.setdefault("mode", "gspro")
+    data["version"] = 2
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(path: Path, file_version: tuple[int, int, int]) -> Settings:
+    """Load a settings file once per version of it on disk.
+
+    The returned instance is shared; callers must copy it before handing it out.
+    Errors propagate, so only successful loads are cached.
+
+    Args:
+        path: Settings file to load.
+        file_version: (mtime_ns, size, inode) of the file, used only as part
+            of the cache key.
+    """
+    del file_version  # Cache key only
+    return Settings._load_file(path)
+
+
+def _write_atomic(path: Path, data: bytes, *, fsync: bool) -> None:
+    """Write data to a temp file beside path, then swap it into place.
+
+    Missing parent directories are created, and the file keeps the
+    existing file's permissions (or gets the umask default if new). A
+    failure at any point leaves the existing file as it was and removes
+    the temp file.
+
+    Args:
+        path: Destination file.
+        data: Complete file contents.
+        fsync: Whether to fsync the temp file before the swap.
+    """
+    fd, tmp_path = _create_temp_beside(path)
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            if fsync:
+                os.fsync(tmp.fileno())
+        mode = _existing_mode(path)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Leave the previous file untouched and don't litter the directory
+        os.unlink(tmp_path)
+        raise
+
+
+def _create_temp_beside(path: Path) -> tuple[int, Path]:
+    """Create the temp file for path, making parent directories on first use.
+
+    The directory usually exists already, so try the create first rather
+    than stat every path component with mkdir(parents=True) on each save.
+    """
+    try:
+        return _create_temp(path)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return _create_temp(path)
+
+
+def _create_temp(path: Path) -> tuple[int, Path]:
+    """Exclusively create a new, randomly named file in path's directory.
+
+    The file is created with mode 0o666 so the kernel applies the process
+    umask, as it would for a plain open().
 
     Returns:
-        Path to settings.json file.
-        - macOS: ~/Library/Application Support/GC2 Connect/settings.json
-        - Linux: ~/.config/gc2-connect/settings.json
+        The open file descriptor and the file's path.
+    """
+    for _ in range(tempfile.TMP_MAX):
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_path, _TEMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temp file name beside {path}")
+
+
+def _existing_mode(path: Path) -> int | None:
+    """Permission bits of the file at path, or None if there is none."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_file(path: Path) -> None:
+    """Fsync an already-written file by path.
+
+    Opened for writing where allowed: Windows refuses to flush a read-only
+    descriptor. A read-only file falls back to O_RDONLY, which POSIX can sync.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except PermissionError:
+        fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Fsync a directory so a rename inside it is durable.
+
+    Skipped where directories cannot be opened (Windows).
     """
-    home = Path.home()
-
-    if sys.platform == "darwin":
-        # macOS
-        return home / "Library" / "Application Support" / "GC2 Connect" / "settings.json"
-    else:
-        # Linux and others
-        return home / ".config" / "gc2-connect" / "settings.json"
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class _PendingSave:
+    """Saved paths awaiting a batched fsync, and the timer that will run it."""
+
+    paths: set[Path] = field(default_factory=set)
+    timer: threading.Timer | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def schedule(self, path: Path) -> None:
+        """Queue path for fsync and restart the quiet-period timer."""
+        with self.lock:
+            self.paths.add(path)
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(SAVE_SYNC_DELAY_S, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self) -> None:
+        """Fsync every queued path and its directory once."""
+        with self.lock:
+            paths, self.paths = self.paths, set()
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        for path in paths:
+            try:
+                _fsync_file(path)
+                _fsync_dir(path.parent)
+            except OSError as e:
+                logger.warning(f"Error syncing settings file {path}: {e}")
+
+
+_pending_sync = _PendingSave()
+atexit.register(_pending_sync.flush)
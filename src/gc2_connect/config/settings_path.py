@@ -0,0 +1,32 @@
+# ABOUTME: Platform-specific location of the GC2 Connect settings file.
+# ABOUTME: Free of pydantic so code that only needs the path imports it cheaply.
+"""Settings file location for GC2 Connect."""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+
+
+@functools.cache
+def get_settings_path() -> Path:
+    """Get the platform-specific settings file path.
+
+    The result is computed once per process: the platform and home directory
+    don't change while the app runs. Call get_settings_path.cache_clear()
+    after patching either (tests only).
+
+    Returns:
+        Path to settings.json file.
+        - macOS: ~/Library/Application Support/GC2 Connect/settings.json
+        - Linux: ~/.config/gc2-connect/settings.json
+    """
+    home = Path.home()
+
+    if sys.platform == "darwin":
+        # macOS
+        return home / "Library" / "Application Support" / "GC2 Connect" / "settings.json"
+    else:
+        # Linux and others
+        return home / ".config" / "gc2-connect" / "settings.json"
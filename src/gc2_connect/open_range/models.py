@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated
 
@@ -23,18 +24,22 @@ class Phase(str, Enum):
     STOPPED = "stopped"
 
 
-class Vec3(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Vec3:
     """3D vector for physics calculations.
 
+    A frozen, slotted dataclass rather than a Pydantic model: vectors are
+    created at a high rate by the simulation and never need validation.
+
     Coordinate system:
     - X: Forward toward target (yards in output, meters in simulation)
     - Y: Vertical height (feet in output, meters in simulation)
     - Z: Lateral (+ = right of target)
     """
 
-    x: Annotated[float, Field(description="X component (forward)")] = 0.0
-    y: Annotated[float, Field(description="Y component (vertical)")] = 0.0
-    z: Annotated[float, Field(description="Z component (lateral)")] = 0.0
+    x: float = 0.0  # X component (forward)
+    y: float = 0.0  # Y component (vertical)
+    z: float = 0.0  # Z component (lateral)
 
     def add(self, other: Vec3) -> Vec3:
         """Add two vectors."""
@@ -54,7 +59,7 @@ class Vec3(BaseModel):
 
     def mag(self) -> float:
         """Calculate magnitude (length) of vector."""
-        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        return math.hypot(self.x, self.y, self.z)
 
     def normalize(self) -> Vec3:
         """Return unit vector in same direction.
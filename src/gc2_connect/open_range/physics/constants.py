@@ -49,6 +49,15 @@ SPIN_DECAY_RATE: float = 0.01  # Per second (1%)
 KINEMATIC_VISCOSITY: float = 1.5e-5  # m²/s at standard conditions
 
 
+# =============================================================================
+# Wind Profile Constants
+# =============================================================================
+
+# Logarithmic profile: V(h) = V_ref × ln(h/z0) / ln(h_ref/z0)
+WIND_ROUGHNESS_FT: float = 0.01  # Roughness length z0 (short grass) in feet
+WIND_REF_HEIGHT_FT: float = 10.0  # Height at which wind speed is measured
+
+
 # =============================================================================
 # Drag Coefficient Constants (from libgolf)
 # =============================================================================
@@ -82,6 +91,7 @@ DT: float = 0.01  # Time step in seconds (10ms)
 MAX_TIME: float = 30.0  # Maximum simulation time in seconds
 MAX_ITERATIONS: int = 3000  # Safety limit on iterations
 MAX_TRAJECTORY_POINTS: int = 600  # Memory limit on stored points
+LANDING_BISECTION_STEPS: int = 4  # Sub-step bisections to locate touchdown
 STOPPED_THRESHOLD: float = 0.1  # Velocity below which ball is "stopped" (m/s)
 MAX_BOUNCES: int = 5  # Maximum number of bounces before forcing roll
 
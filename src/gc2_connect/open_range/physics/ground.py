@@ -76,29 +76,24 @@ class GroundPhysics:
         pos = state.pos
         vel = state.vel
 
-        # Decompose velocity into normal (vertical) and tangential (horizontal) components
-        normal = Vec3(x=0.0, y=1.0, z=0.0)
-
-        # Normal component (should be negative when hitting ground)
-        vn = vel.dot(normal)  # Dot product gives scalar vertical component
-
-        # Tangential components (horizontal)
-        vt = Vec3(x=vel.x, y=0.0, z=vel.z)
+        # Decompose velocity into normal (vertical) and tangential (horizontal)
+        # components. The ground normal is +Y, so the normal component is just
+        # vel.y (negative when hitting ground) and the tangential one is (x, z).
 
         # Apply coefficient of restitution to normal component
         # Reverse direction and reduce by COR
-        vn_new = -vn * self.surface.cor
+        vn_new = -vel.y * self.surface.cor
 
         # Apply friction to tangential component
         # friction_factor = 0.3 is from the libgolf reference
         friction_factor = 0.3
-        vt_new = vt.scale(1.0 - self.surface.friction * friction_factor)
+        vt_scale = 1.0 - self.surface.friction * friction_factor
 
         # Combine velocity components
         new_vel = Vec3(
-            x=vt_new.x,
+            x=vel.x * vt_scale,
             y=vn_new,
-            z=vt_new.z,
+            z=vel.z * vt_scale,
         )
 
         # Reduce spin on bounce (70% retained)
@@ -177,15 +172,19 @@ class GroundPhysics:
                 phase=Phase.STOPPED,
             )
 
-        # Update velocity (same direction, reduced magnitude)
-        direction = vel.normalize()
-        new_vel = direction.scale(new_speed)
+        # Update velocity (same direction, reduced magnitude). Works on the
+        # unit-direction components directly rather than through intermediate
+        # Vec3s, since this runs once per roll step.
+        inv_speed = 1.0 / speed
+        dir_x = vel.x * inv_speed
+        dir_y = vel.y * inv_speed
+        dir_z = vel.z * inv_speed
+        new_vel = Vec3(x=dir_x * new_speed, y=dir_y * new_speed, z=dir_z * new_speed)
 
         # Update position
         # Use average velocity for more accurate position update
-        avg_speed = (speed + new_speed) / 2.0
-        new_pos = pos.add(direction.scale(avg_speed * dt))
-        new_pos = Vec3(x=new_pos.x, y=0.0, z=new_pos.z)  # Keep on ground
+        step = (speed + new_speed) / 2.0 * dt
+        new_pos = Vec3(x=pos.x + dir_x * step, y=0.0, z=pos.z + dir_z * step)  # Keep on ground
 
         # Spin decay during roll (10% per second)
         spin_decay = 1.0 - 0.1 * dt
@@ -15,28 +15,41 @@ Based on:
 
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
 
 from gc2_connect.open_range.models import Conditions, Phase, TrajectoryPoint, Vec3
 from gc2_connect.open_range.physics.aerodynamics import (
     calculate_air_density,
-    calculate_reynolds,
     get_drag_coefficient,
     get_lift_coefficient,
 )
 from gc2_connect.open_range.physics.constants import (
     BALL_AREA_M2,
+    BALL_DIAMETER_M,
     BALL_MASS_KG,
     BALL_RADIUS_M,
     DT,
     GRAVITY_MS2,
+    KINEMATIC_VISCOSITY,
+    LANDING_BISECTION_STEPS,
     MAX_ITERATIONS,
     MAX_TIME,
     MAX_TRAJECTORY_POINTS,
     SPIN_DECAY_RATE,
+    WIND_REF_HEIGHT_FT,
+    WIND_ROUGHNESS_FT,
 )
 
+# Loop-invariant factors folded out of the per-stage force calculations
+_RPM_TO_RAD_S: float = 2.0 * math.pi / 60.0
+_REYNOLDS_PER_MS: float = BALL_DIAMETER_M / KINEMATIC_VISCOSITY
+_INV_BALL_MASS: float = 1.0 / BALL_MASS_KG
+_YARDS_PER_METER: float = 1.0 / 0.9144
+_FEET_PER_METER: float = 1.0 / 0.3048
+_INV_LOG_WIND_REF: float = 1.0 / math.log(WIND_REF_HEIGHT_FT / WIND_ROUGHNESS_FT)
+
 # =============================================================================
 # Unit Conversion Utilities
 # =============================================================================
@@ -92,17 +105,49 @@ def rad_to_deg(rad: float) -> float:
     return rad * 180.0 / math.pi
 
 
+def _flight_point(t: float, x_m: float, y_m: float, z_m: float) -> TrajectoryPoint:
+    """Build a FLIGHT trajectory point from a position in meters.
+
+    Converts to output units (yards forward/lateral, feet height) with
+    folded reciprocal factors rather than three conversion calls per point.
+    """
+    return TrajectoryPoint(
+        t=t,
+        x=x_m * _YARDS_PER_METER,
+        y=y_m * _FEET_PER_METER,
+        z=z_m * _YARDS_PER_METER,
+        phase=Phase.FLIGHT,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_air_density(temp_f: float, elevation_ft: float, humidity_pct: float) -> float:
+    """Air density for a set of conditions, memoized.
+
+    Simulators are rebuilt whenever conditions or the surface change, usually
+    with a handful of distinct weather settings, so repeats are cache hits.
+    """
+    return calculate_air_density(
+        temp_f=temp_f,
+        elevation_ft=elevation_ft,
+        humidity_pct=humidity_pct,
+    )
+
+
 # =============================================================================
 # Simulation State
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """Current state of ball during simulation.
 
     All positions and velocities are in SI units (meters, m/s).
     Spin values are in RPM for consistency with input.
+
+    Slotted so attribute reads in the bounce/roll loop skip the
+    per-instance __dict__ lookup.
     """
 
     pos: Vec3
@@ -111,6 +156,7 @@ class SimulationState:
     spin_side: float  # RPM
     t: float  # seconds
     phase: Phase
+    apex_y: float = 0.0  # highest height reached so far, meters
 
 
 def calculate_initial_velocity(
@@ -128,9 +174,9 @@ def calculate_initial_velocity(
     Returns:
         Initial velocity vector in m/s (Vec3).
     """
-    speed_ms = mph_to_ms(ball_speed_mph)
-    vla_rad = deg_to_rad(vla_deg)
-    hla_rad = deg_to_rad(hla_deg)
+    speed_ms = ball_speed_mph * 0.44704  # mph to m/s
+    vla_rad = math.radians(vla_deg)
+    hla_rad = math.radians(hla_deg)
 
     # First get horizontal and vertical components
     horizontal_speed = speed_ms * math.cos(vla_rad)
@@ -169,11 +215,22 @@ class FlightSimulator:
         """
         self.conditions = conditions
         self.dt = dt
-        self.air_density = calculate_air_density(
-            temp_f=conditions.temp_f,
-            elevation_ft=conditions.elevation_ft,
-            humidity_pct=conditions.humidity_pct,
+        self.air_density = _compute_air_density(
+            conditions.temp_f,
+            conditions.elevation_ft,
+            conditions.humidity_pct,
         )
+        # Dynamic pressure × area per (m/s)², i.e. F = factor × v² × C
+        self._force_factor = 0.5 * self.air_density * BALL_AREA_M2
+        # Wind at the reference height, resolved into (x, z) once per simulator.
+        # Direction: 0° = from north (headwind), 90° = from east (left-to-right)
+        # Headwind opposes forward motion (negative X)
+        # Crosswind from east pushes right (positive Z)
+        self._wind_calm = conditions.wind_speed_mph < 0.1
+        wind_speed_ms = mph_to_ms(conditions.wind_speed_mph)
+        wind_dir_rad = deg_to_rad(conditions.wind_dir_deg)
+        self._wind_ref_x = -wind_speed_ms * math.cos(wind_dir_rad)
+        self._wind_ref_z = wind_speed_ms * math.sin(wind_dir_rad)
 
     def get_wind_at_height(self, height_m: float) -> Vec3:
         """Get wind velocity at given height using logarithmic profile.
@@ -187,36 +244,37 @@ class FlightSimulator:
         Returns:
             Wind velocity vector in m/s.
         """
-        if self.conditions.wind_speed_mph < 0.1:
-            return Vec3(x=0.0, y=0.0, z=0.0)
+        wind_x, wind_z = self._wind_components(height_m)
+        return Vec3(x=wind_x, y=0.0, z=wind_z)
 
-        height_ft = meters_to_feet(height_m)
+    def _wind_components(self, height_m: float) -> tuple[float, float]:
+        """Get horizontal wind components at given height.
 
-        # Logarithmic wind profile constants
-        z0 = 0.01  # Roughness length (short grass) in feet
-        ref_height = 10.0  # Reference height in feet
+        Scalar form of get_wind_at_height() used by the integrator so the
+        hot loop does not allocate a Vec3 per force evaluation. Wind has
+        no vertical component.
+
+        Args:
+            height_m: Height above ground in meters.
+
+        Returns:
+            Tuple of (x, z) wind velocity in m/s.
+        """
+        if self._wind_calm:
+            return 0.0, 0.0
+
+        height_ft = height_m / 0.3048
 
         # Calculate height factor
         # At ground level (h <= z0), wind is near zero
         # At reference height, factor = 1.0
         # Above reference height, factor > 1.0
-        if height_ft <= z0:
-            factor = 0.0
-        else:
-            factor = math.log(height_ft / z0) / math.log(ref_height / z0)
-            factor = max(0.0, min(factor, 2.0))  # Clamp to reasonable range
-
-        wind_speed_ms = mph_to_ms(self.conditions.wind_speed_mph) * factor
-        wind_dir_rad = deg_to_rad(self.conditions.wind_dir_deg)
+        if height_ft <= WIND_ROUGHNESS_FT:
+            return 0.0, 0.0
+        factor = math.log(height_ft / WIND_ROUGHNESS_FT) * _INV_LOG_WIND_REF
+        factor = max(0.0, min(factor, 2.0))  # Clamp to reasonable range
 
-        # Wind direction: 0° = from north (headwind), 90° = from east (left-to-right)
-        # Headwind opposes forward motion (negative X)
-        # Crosswind from east pushes right (positive Z)
-        return Vec3(
-            x=-wind_speed_ms * math.cos(wind_dir_rad),
-            y=0.0,
-            z=wind_speed_ms * math.sin(wind_dir_rad),
-        )
+        return self._wind_ref_x * factor, self._wind_ref_z * factor
 
     def _gravity_force(self) -> Vec3:
         """Calculate gravity force on ball.
@@ -247,36 +305,8 @@ class FlightSimulator:
         Returns:
             Drag force vector in Newtons.
         """
-        # Get wind at current height
-        wind = self.get_wind_at_height(pos.y)
-
-        # Relative velocity (ball velocity in wind frame)
-        rel_vel = vel.sub(wind)
-        speed = rel_vel.mag()
-
-        if speed < 0.01:
-            return Vec3(x=0.0, y=0.0, z=0.0)
-
-        # Calculate spin factor for drag term
-        omega_back = rpm_to_rad_s(abs(spin_back))
-        omega_side = rpm_to_rad_s(abs(spin_side))
-        omega_total = math.sqrt(omega_back * omega_back + omega_side * omega_side)
-        spin_factor = (omega_total * BALL_RADIUS_M) / speed if speed > 0.1 else 0.0
-
-        # Get drag coefficient
-        reynolds = calculate_reynolds(speed, self.air_density)
-        cd = get_drag_coefficient(reynolds, spin_factor)
-
-        # Dynamic pressure: q = 0.5 × ρ × v²
-        q = 0.5 * self.air_density * speed * speed
-
-        # Drag magnitude: F = q × Cd × A
-        drag_magnitude = q * cd * BALL_AREA_M2
-
-        # Drag direction: opposes relative velocity
-        drag_direction = rel_vel.normalize().neg()
-
-        return drag_direction.scale(drag_magnitude)
+        forces = self._aero_forces(pos.y, vel.x, vel.y, vel.z, spin_back, spin_side)
+        return Vec3(x=forces[0], y=forces[1], z=forces[2])
 
     def _magnus_force(
         self,
@@ -304,40 +334,77 @@ class FlightSimulator:
         Returns:
             Magnus force vector in Newtons.
         """
-        # Get wind at current height
-        wind = self.get_wind_at_height(pos.y)
+        forces = self._aero_forces(pos.y, vel.x, vel.y, vel.z, spin_back, spin_side)
+        return Vec3(x=forces[3], y=forces[4], z=forces[5])
+
+    def _aero_forces(
+        self,
+        height_m: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        spin_back: float,
+        spin_side: float,
+    ) -> tuple[float, float, float, float, float, float]:
+        """Calculate drag and Magnus forces in one pass.
 
-        # Relative velocity
-        rel_vel = vel.sub(wind)
-        speed = rel_vel.mag()
+        Both forces depend on the same relative velocity, speed, spin rate
+        and dynamic pressure, so they are computed together: one wind
+        lookup and one square root per force evaluation. See _drag_force()
+        and _magnus_force() for the models.
+
+        Args:
+            height_m: Ball height in meters (for the wind profile).
+            vx: Ball velocity X component in m/s.
+            vy: Ball velocity Y component in m/s.
+            vz: Ball velocity Z component in m/s.
+            spin_back: Backspin in RPM.
+            spin_side: Sidespin in RPM.
+
+        Returns:
+            Tuple of (drag x, y, z, Magnus x, y, z) in Newtons.
+        """
+        # Relative velocity (ball velocity in wind frame). Calm air is the
+        # default, so skip the wind profile call entirely in that case.
+        if self._wind_calm:
+            rel_x = vx
+            rel_z = vz
+        else:
+            wind_x, wind_z = self._wind_components(height_m)
+            rel_x = vx - wind_x
+            rel_z = vz - wind_z
+        rel_y = vy
+        speed = math.hypot(rel_x, rel_y, rel_z)
 
         if speed < 0.01:
-            return Vec3(x=0.0, y=0.0, z=0.0)
+            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
 
         # Convert spin to rad/s
-        omega_back = rpm_to_rad_s(spin_back)
-        omega_side = rpm_to_rad_s(spin_side)
+        omega_back = spin_back * _RPM_TO_RAD_S
+        omega_side = spin_side * _RPM_TO_RAD_S
 
-        # Total spin rate for spin factor calculation
-        omega_total = math.sqrt(omega_back * omega_back + omega_side * omega_side)
+        # Total spin rate and spin factor: S = (ω × r) / V
+        omega_total = math.hypot(omega_back, omega_side)
+        spin_factor = (omega_total * BALL_RADIUS_M) / speed
 
-        if omega_total < 0.1:
-            return Vec3(x=0.0, y=0.0, z=0.0)
+        # Dynamic pressure × area: q × A with q = 0.5 × ρ × v²
+        q_area = self._force_factor * speed * speed
 
-        # Spin factor: S = (ω × r) / V
-        spin_factor = (omega_total * BALL_RADIUS_M) / speed
+        # Drag: F = q × Cd × A, opposing relative velocity (Re = V × D / ν)
+        cd = get_drag_coefficient(speed * _REYNOLDS_PER_MS, spin_factor if speed > 0.1 else 0.0)
+        k = -q_area * cd / speed
+        drag_x = rel_x * k
+        drag_y = rel_y * k
+        drag_z = rel_z * k
+
+        if omega_total < 0.1:
+            return drag_x, drag_y, drag_z, 0.0, 0.0, 0.0
 
         # Get lift coefficient
         cl = get_lift_coefficient(spin_factor)
 
         if cl < 0.001:
-            return Vec3(x=0.0, y=0.0, z=0.0)
-
-        # Dynamic pressure
-        q = 0.5 * self.air_density * speed * speed
-
-        # Magnus magnitude: F = q × Cl × A
-        magnus_magnitude = q * cl * BALL_AREA_M2
+            return drag_x, drag_y, drag_z, 0.0, 0.0, 0.0
 
         # Build the spin vector in the ball's reference frame
         # The spin axis orientation depends on the type of spin:
@@ -353,47 +420,48 @@ class FlightSimulator:
         # - For a slice (positive sidespin), the axis is tilted to produce rightward force
         # - The spin axis for sidespin is approximately vertical but tilted
 
-        # Get velocity direction
-        vel_dir = rel_vel.normalize()
-
         # For backspin, the spin axis is perpendicular to velocity in the horizontal plane
         # velocity_direction × UP gives the correct spin axis for backspin
         # (not UP × velocity, which gives the opposite direction)
-        up = Vec3(x=0.0, y=1.0, z=0.0)
-
-        # Backspin axis: vel_dir × UP
+        #
+        # Backspin axis: vel_dir × UP = (-dir_z, 0, dir_x)
         # For forward motion (+X), this gives +Z direction
         # Then spin × velocity = (+Z) × (+X) = +Y (upward lift)
-        backspin_axis = vel_dir.cross(up)
-        if backspin_axis.mag() > 0.001:
-            backspin_axis = backspin_axis.normalize()
+        axis_x = -rel_z / speed
+        axis_z = rel_x / speed
+        axis_mag = math.hypot(axis_x, axis_z)
+        if axis_mag > 0.001:
+            axis_x /= axis_mag
+            axis_z /= axis_mag
         else:
             # Ball moving straight up/down - assume standard backspin axis
-            backspin_axis = Vec3(x=0.0, y=0.0, z=1.0)
+            axis_x, axis_z = 0.0, 1.0
 
         # For sidespin, the spin axis is approximately vertical
         # Positive sidespin (slice): ball curves right
         # The spin axis is tilted from vertical toward the velocity direction
         # For simplicity, we use the UP vector for sidespin axis
         # Then spin × velocity = (+Y) × (+X) = -Z (leftward force for positive Y spin)
-        # But we want positive sidespin to curve right (+Z), so we negate the axis
-        sidespin_axis = Vec3(x=0.0, y=-1.0, z=0.0)  # Negative Y axis for positive sidespin
+        # But we want positive sidespin to curve right (+Z), so we use the -Y axis
 
         # Build combined spin vector (in rad/s)
         # The relative contribution depends on the spin rates
-        spin_vec = backspin_axis.scale(omega_back).add(sidespin_axis.scale(omega_side))
+        spin_x = axis_x * omega_back
+        spin_y = -omega_side
+        spin_z = axis_z * omega_back
 
         # Magnus force direction: spin × velocity
-        magnus_dir = spin_vec.cross(rel_vel)
-        magnus_mag_vec = magnus_dir.mag()
+        dir_x = spin_y * rel_z - spin_z * rel_y
+        dir_y = spin_z * rel_x - spin_x * rel_z
+        dir_z = spin_x * rel_y - spin_y * rel_x
+        dir_mag = math.hypot(dir_x, dir_y, dir_z)
 
-        if magnus_mag_vec < 0.001:
-            return Vec3(x=0.0, y=0.0, z=0.0)
+        if dir_mag < 0.001:
+            return drag_x, drag_y, drag_z, 0.0, 0.0, 0.0
 
-        # Normalize and scale by the magnitude calculated from Cl
-        magnus_dir = magnus_dir.scale(1.0 / magnus_mag_vec)
-
-        return magnus_dir.scale(magnus_magnitude)
+        # Normalize and scale by the magnitude from Cl: F = q × Cl × A
+        k = q_area * cl / dir_mag
+        return drag_x, drag_y, drag_z, dir_x * k, dir_y * k, dir_z * k
 
     def calculate_acceleration(
         self,
@@ -413,78 +481,168 @@ class FlightSimulator:
         Returns:
             Total acceleration in m/s².
         """
-        gravity = self._gravity_force()
-        drag = self._drag_force(pos, vel, spin_back, spin_side)
-        magnus = self._magnus_force(pos, vel, spin_back, spin_side)
+        ax, ay, az = self._acceleration(pos.y, vel.x, vel.y, vel.z, spin_back, spin_side)
+        return Vec3(x=ax, y=ay, z=az)
 
-        total_force = gravity.add(drag).add(magnus)
+    def _acceleration(
+        self,
+        height_m: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        spin_back: float,
+        spin_side: float,
+    ) -> tuple[float, float, float]:
+        """Calculate total acceleration from all forces as scalar components.
 
-        # a = F / m
-        return total_force.scale(1.0 / BALL_MASS_KG)
+        Returns:
+            Tuple of (x, y, z) acceleration in m/s².
+        """
+        drag_x, drag_y, drag_z, magnus_x, magnus_y, magnus_z = self._aero_forces(
+            height_m, vx, vy, vz, spin_back, spin_side
+        )
 
-    def rk4_step(self, state: SimulationState) -> SimulationState:
-        """Perform one 4th-order Runge-Kutta integration step.
+        # a = F / m, with gravity applied directly as an acceleration
+        return (
+            (drag_x + magnus_x) * _INV_BALL_MASS,
+            (drag_y + magnus_y) * _INV_BALL_MASS - GRAVITY_MS2,
+            (drag_z + magnus_z) * _INV_BALL_MASS,
+        )
 
-        RK4 provides good accuracy with O(dt^5) local error.
+    def _integrate(
+        self,
+        px: float,
+        py: float,
+        pz: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        spin_back: float,
+        spin_side: float,
+        dt: float,
+    ) -> tuple[float, float, float, float, float, float]:
+        """Advance position and velocity by one RK4 step of length dt.
 
-        Args:
-            state: Current simulation state.
+        The state is carried as plain floats rather than Vec3 objects so
+        each step costs four force evaluations and no allocations beyond
+        the returned tuple. Spin is held constant across the step.
 
         Returns:
-            New simulation state after dt.
+            Tuple of (px, py, pz, vx, vy, vz) after dt.
         """
-        dt = self.dt
-        pos = state.pos
-        vel = state.vel
-        spin_back = state.spin_back
-        spin_side = state.spin_side
-
-        # Apply spin decay for this step
-        decay = 1.0 - SPIN_DECAY_RATE * dt
-        new_spin_back = spin_back * decay
-        new_spin_side = spin_side * decay
+        half_dt = dt / 2
+        accel = self._acceleration
 
         # k1 = f(t, y)
-        a1 = self.calculate_acceleration(pos, vel, spin_back, spin_side)
-        k1_pos = vel
-        k1_vel = a1
+        a1x, a1y, a1z = accel(py, vx, vy, vz, spin_back, spin_side)
 
         # k2 = f(t + dt/2, y + dt/2 * k1)
-        pos2 = pos.add(k1_pos.scale(dt / 2))
-        vel2 = vel.add(k1_vel.scale(dt / 2))
-        a2 = self.calculate_acceleration(pos2, vel2, spin_back, spin_side)
-        k2_pos = vel2
-        k2_vel = a2
+        v2x = vx + a1x * half_dt
+        v2y = vy + a1y * half_dt
+        v2z = vz + a1z * half_dt
+        a2x, a2y, a2z = accel(py + vy * half_dt, v2x, v2y, v2z, spin_back, spin_side)
 
         # k3 = f(t + dt/2, y + dt/2 * k2)
-        pos3 = pos.add(k2_pos.scale(dt / 2))
-        vel3 = vel.add(k2_vel.scale(dt / 2))
-        a3 = self.calculate_acceleration(pos3, vel3, spin_back, spin_side)
-        k3_pos = vel3
-        k3_vel = a3
+        v3x = vx + a2x * half_dt
+        v3y = vy + a2y * half_dt
+        v3z = vz + a2z * half_dt
+        a3x, a3y, a3z = accel(py + v2y * half_dt, v3x, v3y, v3z, spin_back, spin_side)
 
         # k4 = f(t + dt, y + dt * k3)
-        pos4 = pos.add(k3_pos.scale(dt))
-        vel4 = vel.add(k3_vel.scale(dt))
-        a4 = self.calculate_acceleration(pos4, vel4, spin_back, spin_side)
-        k4_pos = vel4
-        k4_vel = a4
+        v4x = vx + a3x * dt
+        v4y = vy + a3y * dt
+        v4z = vz + a3z * dt
+        a4x, a4y, a4z = accel(py + v3y * dt, v4x, v4y, v4z, spin_back, spin_side)
 
         # Combine: y_new = y + dt/6 * (k1 + 2*k2 + 2*k3 + k4)
-        new_pos = pos.add(
-            k1_pos.add(k2_pos.scale(2)).add(k3_pos.scale(2)).add(k4_pos).scale(dt / 6)
+        sixth_dt = dt / 6
+        return (
+            px + (vx + 2 * v2x + 2 * v3x + v4x) * sixth_dt,
+            py + (vy + 2 * v2y + 2 * v3y + v4y) * sixth_dt,
+            pz + (vz + 2 * v2z + 2 * v3z + v4z) * sixth_dt,
+            vx + (a1x + 2 * a2x + 2 * a3x + a4x) * sixth_dt,
+            vy + (a1y + 2 * a2y + 2 * a3y + a4y) * sixth_dt,
+            vz + (a1z + 2 * a2z + 2 * a3z + a4z) * sixth_dt,
+        )
+
+    def _find_landing(
+        self,
+        before: tuple[float, float, float, float, float, float],
+        after: tuple[float, float, float, float, float, float],
+        spin_back: float,
+        spin_side: float,
+        dt: float,
+    ) -> tuple[float, tuple[float, float, float, float, float, float]]:
+        """Locate the ground crossing inside a step that went below y = 0.
+
+        Bisects the step with shorter RK4 sub-steps from the last state
+        above ground, then linearly interpolates inside the final bracket.
+        This keeps touchdown accurate without shrinking the global dt.
+
+        Args:
+            before: (px, py, pz, vx, vy, vz) at the start of the step (y > 0).
+            after: (px, py, pz, vx, vy, vz) at the end of the step (y <= 0).
+            spin_back: Backspin in RPM during the step.
+            spin_side: Sidespin in RPM during the step.
+            dt: Length of the step in seconds.
+
+        Returns:
+            Tuple of (time into the step, interpolated state at landing).
+        """
+        lo, hi = 0.0, dt
+        lo_state, hi_state = before, after
+        for _ in range(LANDING_BISECTION_STEPS):
+            mid = 0.5 * (lo + hi)
+            mid_state = self._integrate(*before, spin_back, spin_side, mid)
+            if mid_state[1] > 0:
+                lo, lo_state = mid, mid_state
+            else:
+                hi, hi_state = mid, mid_state
+
+        # Linear interpolation inside the remaining bracket
+        t_ratio = lo_state[1] / (lo_state[1] - hi_state[1])
+        t_ratio = max(0.0, min(1.0, t_ratio))
+        px, py, pz, vx, vy, vz = (
+            a + t_ratio * (b - a) for a, b in zip(lo_state, hi_state, strict=True)
         )
-        new_vel = vel.add(
-            k1_vel.add(k2_vel.scale(2)).add(k3_vel.scale(2)).add(k4_vel).scale(dt / 6)
+        return lo + t_ratio * (hi - lo), (px, py, pz, vx, vy, vz)
+
+    def rk4_step(self, state: SimulationState) -> SimulationState:
+        """Perform one 4th-order Runge-Kutta integration step.
+
+        RK4 provides good accuracy with O(dt^5) local error.
+
+        Args:
+            state: Current simulation state.
+
+        Returns:
+            New simulation state after dt.
+        """
+        dt = self.dt
+
+        # Apply spin decay for this step: ω(t + dt) = ω(t) × e^(-k × dt)
+        decay = math.exp(-SPIN_DECAY_RATE * dt)
+
+        px, py, pz, vx, vy, vz = self._integrate(
+            state.pos.x,
+            state.pos.y,
+            state.pos.z,
+            state.vel.x,
+            state.vel.y,
+            state.vel.z,
+            state.spin_back,
+            state.spin_side,
+            dt,
         )
 
         return SimulationState(
-            pos=new_pos,
-            vel=new_vel,
-            spin_back=new_spin_back,
-            spin_side=new_spin_side,
+            pos=Vec3(x=px, y=py, z=pz),
+            vel=Vec3(x=vx, y=vy, z=vz),
+            spin_back=state.spin_back * decay,
+            spin_side=state.spin_side * decay,
             t=state.t + dt,
             phase=Phase.FLIGHT,
+            apex_y=max(state.apex_y, py),
         )
 
     def simulate_flight(
@@ -512,14 +670,7 @@ class FlightSimulator:
 
         # Handle zero or negative ball speed
         if ball_speed_mph <= 0:
-            initial_point = TrajectoryPoint(
-                t=0.0,
-                x=0.0,
-                y=0.0,
-                z=0.0,
-                phase=Phase.FLIGHT,
-            )
-            trajectory.append(initial_point)
+            trajectory.append(_flight_point(0.0, 0.0, 0.0, 0.0))
             final_state = SimulationState(
                 pos=Vec3(x=0, y=0, z=0),
                 vel=Vec3(x=0, y=0, z=0),
@@ -530,30 +681,26 @@ class FlightSimulator:
             )
             return trajectory, final_state
 
-        # Initialize state
+        # Initialize state. The loop carries position, velocity and spin as
+        # plain floats; Vec3/SimulationState are only built for the result.
         initial_vel = calculate_initial_velocity(ball_speed_mph, vla_deg, hla_deg)
-        state = SimulationState(
-            pos=Vec3(x=0.0, y=0.0, z=0.0),
-            vel=initial_vel,
-            spin_back=backspin_rpm,
-            spin_side=sidespin_rpm,
-            t=0.0,
-            phase=Phase.FLIGHT,
-        )
+        px, py, pz = 0.0, 0.0, 0.0
+        vx, vy, vz = initial_vel.x, initial_vel.y, initial_vel.z
+        spin_back = backspin_rpm
+        spin_side = sidespin_rpm
+        t = 0.0
+        apex_y = 0.0
 
         # Add initial point
-        trajectory.append(
-            TrajectoryPoint(
-                t=0.0,
-                x=0.0,
-                y=0.0,
-                z=0.0,
-                phase=Phase.FLIGHT,
-            )
-        )
+        trajectory.append(_flight_point(0.0, 0.0, 0.0, 0.0))
+
+        dt = self.dt
+        # Spin decays exponentially, ω(t) = ω0 × e^(-k × t), so a single
+        # per-step factor reproduces it exactly at every step boundary
+        decay = math.exp(-SPIN_DECAY_RATE * dt)
 
         # Sampling rate for trajectory output (every N steps)
-        sample_interval = max(1, int(0.02 / self.dt))  # Sample every 20ms
+        sample_interval = max(1, int(0.02 / dt))  # Sample every 20ms
         step_count = 0
 
         # Main simulation loop
@@ -563,67 +710,62 @@ class FlightSimulator:
             step_count += 1
 
             # Advance state
-            new_state = self.rk4_step(state)
+            npx, npy, npz, nvx, nvy, nvz = self._integrate(
+                px, py, pz, vx, vy, vz, spin_back, spin_side, dt
+            )
 
             # Check for landing (y <= 0 and was previously above ground)
-            if new_state.pos.y <= 0 and state.pos.y > 0:
-                # Interpolate to find exact landing position
-                # Linear interpolation between state and new_state
-                t_ratio = state.pos.y / (state.pos.y - new_state.pos.y)
-                t_ratio = max(0.0, min(1.0, t_ratio))
-
-                landing_pos = Vec3(
-                    x=state.pos.x + t_ratio * (new_state.pos.x - state.pos.x),
-                    y=0.0,
-                    z=state.pos.z + t_ratio * (new_state.pos.z - state.pos.z),
+            if npy <= 0 and py > 0:
+                landing_h, (lpx, _, lpz, lvx, lvy, lvz) = self._find_landing(
+                    (px, py, pz, vx, vy, vz),
+                    (npx, npy, npz, nvx, nvy, nvz),
+                    spin_back,
+                    spin_side,
+                    dt,
                 )
-                landing_vel = Vec3(
-                    x=state.vel.x + t_ratio * (new_state.vel.x - state.vel.x),
-                    y=state.vel.y + t_ratio * (new_state.vel.y - state.vel.y),
-                    z=state.vel.z + t_ratio * (new_state.vel.z - state.vel.z),
-                )
-                landing_t = state.t + t_ratio * self.dt
+                landing_pos = Vec3(x=lpx, y=0.0, z=lpz)
+                landing_vel = Vec3(x=lvx, y=lvy, z=lvz)
+                landing_t = t + landing_h
+                landing_decay = math.exp(-SPIN_DECAY_RATE * landing_h)
 
                 final_state = SimulationState(
                     pos=landing_pos,
                     vel=landing_vel,
-                    spin_back=new_state.spin_back,
-                    spin_side=new_state.spin_side,
+                    spin_back=spin_back * landing_decay,
+                    spin_side=spin_side * landing_decay,
                     t=landing_t,
                     phase=Phase.FLIGHT,
+                    apex_y=apex_y,
                 )
 
                 # Add landing point to trajectory
-                trajectory.append(
-                    TrajectoryPoint(
-                        t=landing_t,
-                        x=meters_to_yards(landing_pos.x),
-                        y=meters_to_feet(landing_pos.y),
-                        z=meters_to_yards(landing_pos.z),
-                        phase=Phase.FLIGHT,
-                    )
-                )
+                trajectory.append(_flight_point(landing_t, lpx, 0.0, lpz))
 
                 return trajectory, final_state
 
-            state = new_state
+            px, py, pz, vx, vy, vz = npx, npy, npz, nvx, nvy, nvz
+            if py > apex_y:
+                apex_y = py
+            spin_back *= decay
+            spin_side *= decay
+            t += dt
 
             # Check time limit
-            if state.t >= MAX_TIME:
+            if t >= MAX_TIME:
                 break
 
             # Sample trajectory point
             if step_count >= sample_interval and len(trajectory) < MAX_TRAJECTORY_POINTS:
-                trajectory.append(
-                    TrajectoryPoint(
-                        t=state.t,
-                        x=meters_to_yards(state.pos.x),
-                        y=meters_to_feet(state.pos.y),
-                        z=meters_to_yards(state.pos.z),
-                        phase=Phase.FLIGHT,
-                    )
-                )
+                trajectory.append(_flight_point(t, px, py, pz))
                 step_count = 0
 
         # Time limit reached - return current state
-        return trajectory, state
+        return trajectory, SimulationState(
+            pos=Vec3(x=px, y=py, z=pz),
+            vel=Vec3(x=vx, y=vy, z=vz),
+            spin_back=spin_back,
+            spin_side=spin_side,
+            t=t,
+            phase=Phase.FLIGHT,
+            apex_y=apex_y,
+        )
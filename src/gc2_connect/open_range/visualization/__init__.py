@@ -35,6 +35,7 @@ from gc2_connect.open_range.visualization.range_scene import (
 )
 from gc2_connect.open_range.visualization.trajectory_trace import (
     TRACE_COLORS,
+    SegmentView,
     TraceSegment,
     TrajectoryTrace,
     get_phase_color,
@@ -63,6 +64,7 @@ __all__ = [
     # TrajectoryTrace exports
     "TrajectoryTrace",
     "TraceSegment",
+    "SegmentView",
     "TRACE_COLORS",
     "get_phase_color",
 ]
@@ -18,8 +18,11 @@ Animation phases:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from gc2_connect.open_range.models import Phase, TrajectoryPoint, Vec3
@@ -30,12 +33,14 @@ if TYPE_CHECKING:
 
 
 # Phase colors (hex strings for Three.js materials)
-PHASE_COLORS: dict[Phase, str] = {
-    Phase.FLIGHT: "#00ff88",  # Green - ball in flight
-    Phase.BOUNCE: "#ff8844",  # Orange - ground contact
-    Phase.ROLLING: "#00d4ff",  # Blue - rolling
-    Phase.STOPPED: "#888888",  # Gray - at rest
-}
+PHASE_COLORS: Mapping[Phase, str] = MappingProxyType(
+    {
+        Phase.FLIGHT: "#00ff88",  # Green - ball in flight
+        Phase.BOUNCE: "#ff8844",  # Orange - ground contact
+        Phase.ROLLING: "#00d4ff",  # Blue - rolling
+        Phase.STOPPED: "#888888",  # Gray - at rest
+    }
+)
 
 # Camera configuration
 CAMERA_FOLLOW_DISTANCE: float = 40.0  # Yards behind ball
@@ -48,6 +53,8 @@ CAMERA_END_DELAY: float = 2.0  # Seconds to show final position before resetting
 DEFAULT_TARGET_FPS: int = 60
 DEFAULT_SPEED_MULTIPLIER: float = 1.0
 
+_point_time = attrgetter("t")
+
 
 @dataclass
 class AnimationFrame:
@@ -58,23 +65,28 @@ class AnimationFrame:
     time: float
 
 
-def get_tee_box_camera() -> tuple[Vec3, Vec3]:
-    """Get the default tee box camera position and look-at.
-
-    Returns:
-        Tuple of (camera_position, look_at_position) for tee box view.
-    """
-    camera_pos = Vec3(
+# Tee box view. Vec3 is immutable, so the same pair is handed out every time.
+_TEE_BOX_CAMERA: tuple[Vec3, Vec3] = (
+    Vec3(
         x=CAMERA_LATERAL_OFFSET,  # Offset to the right
         y=CAMERA_HEIGHT_OFFSET,  # Above ground
         z=-CAMERA_FOLLOW_DISTANCE,  # Behind tee
-    )
-    look_at = Vec3(
+    ),
+    Vec3(
         x=0.0,  # Center of range
         y=5.0,  # Slightly above ground
         z=100.0,  # Looking down range
-    )
-    return camera_pos, look_at
+    ),
+)
+
+
+def get_tee_box_camera() -> tuple[Vec3, Vec3]:
+    """Get the default tee box camera position and look-at.
+
+    Returns:
+        Tuple of (camera_position, look_at_position) for tee box view.
+    """
+    return _TEE_BOX_CAMERA
 
 
 def calculate_follow_camera(ball_z: float, target_z: float) -> tuple[Vec3, Vec3]:
@@ -96,7 +108,10 @@ def calculate_follow_camera(ball_z: float, target_z: float) -> tuple[Vec3, Vec3]
         Tuple of (camera_position, look_at_position) in scene coordinates.
     """
     # Camera follows behind the ball, but stays at a minimum distance back
-    camera_z = max(ball_z - CAMERA_FOLLOW_DISTANCE, -CAMERA_FOLLOW_DISTANCE)
+    # (never in front of the tee box position)
+    camera_z = ball_z - CAMERA_FOLLOW_DISTANCE
+    if camera_z < -CAMERA_FOLLOW_DISTANCE:
+        camera_z = -CAMERA_FOLLOW_DISTANCE
 
     camera_pos = Vec3(
         x=CAMERA_LATERAL_OFFSET,  # Fixed lateral offset
@@ -114,6 +129,19 @@ def calculate_follow_camera(ball_z: float, target_z: float) -> tuple[Vec3, Vec3]
     return camera_pos, look_at
 
 
+def _lerp(p1: TrajectoryPoint, p2: TrajectoryPoint, time: float) -> Vec3:
+    """Linearly interpolate the position between two points at a time."""
+    # Linear interpolation factor
+    dt = p2.t - p1.t
+    t = 0.0 if dt == 0 else (time - p1.t) / dt
+
+    return Vec3(
+        x=p1.x + t * (p2.x - p1.x),
+        y=p1.y + t * (p2.y - p1.y),
+        z=p1.z + t * (p2.z - p1.z),
+    )
+
+
 class BallAnimator:
     """Animates ball along trajectory path.
 
@@ -131,12 +159,25 @@ class BallAnimator:
 
     def __init__(self) -> None:
         """Initialize the ball animator."""
-        self.trajectory: list[TrajectoryPoint] = []
+        self._trajectory: list[TrajectoryPoint] = []
+        self._times: list[float] = []
         self.current_frame: int = 0
         self.is_animating: bool = False
         self.current_phase: Phase = Phase.STOPPED
         self._animation_task: asyncio.Task[None] | None = None
 
+    @property
+    def trajectory(self) -> list[TrajectoryPoint]:
+        """Trajectory being animated, in time order."""
+        return self._trajectory
+
+    @trajectory.setter
+    def trajectory(self, trajectory: list[TrajectoryPoint]) -> None:
+        # Cache the (monotonic) time column so per-frame lookups can bisect.
+        # Assign a new list rather than mutating the current one in place.
+        self._trajectory = trajectory
+        self._times = [point.t for point in trajectory]
+
     def calculate_animation_frames(
         self,
         trajectory: list[TrajectoryPoint],
@@ -167,13 +208,24 @@ class BallAnimator:
         # Calculate frame interval based on speed
         frame_interval = (1.0 / target_fps) * speed_multiplier
 
-        # Generate frames at regular intervals
+        # Generate frames at regular intervals. Frame times only increase, so
+        # a single forward sweep finds each frame's bracketing points (the
+        # same pair _interpolate_position would bisect for).
         frames: list[Vec3] = []
         current_time = 0.0
+        first = trajectory[0]
+        last = trajectory[-1]
+        end = 1  # First point with t >= current_time once inside the trajectory
 
         while current_time <= total_time:
-            pos = self._interpolate_position(trajectory, current_time)
-            frames.append(pos)
+            if current_time <= first.t:
+                frames.append(Vec3(x=first.x, y=first.y, z=first.z))
+            elif current_time >= last.t:
+                frames.append(Vec3(x=last.x, y=last.y, z=last.z))
+            else:
+                while trajectory[end].t < current_time:
+                    end += 1
+                frames.append(_lerp(trajectory[end - 1], trajectory[end], current_time))
             current_time += frame_interval
 
         # Ensure last frame matches end of trajectory
@@ -182,12 +234,18 @@ class BallAnimator:
 
         return frames
 
-    def _interpolate_position(self, trajectory: list[TrajectoryPoint], time: float) -> Vec3:
+    def _interpolate_position(
+        self,
+        trajectory: list[TrajectoryPoint],
+        time: float,
+        times: list[float] | None = None,
+    ) -> Vec3:
         """Interpolate position at a specific time.
 
         Args:
-            trajectory: Trajectory points.
+            trajectory: Trajectory points, in time order.
             time: Time to interpolate at.
+            times: Precomputed time column of trajectory, if available.
 
         Returns:
             Interpolated position as Vec3.
@@ -202,24 +260,13 @@ class BallAnimator:
         if time >= trajectory[-1].t:
             return Vec3(x=trajectory[-1].x, y=trajectory[-1].y, z=trajectory[-1].z)
 
-        # Find the two points to interpolate between
-        for i in range(len(trajectory) - 1):
-            p1 = trajectory[i]
-            p2 = trajectory[i + 1]
-
-            if p1.t <= time <= p2.t:
-                # Linear interpolation factor
-                dt = p2.t - p1.t
-                t = 0.0 if dt == 0 else (time - p1.t) / dt
-
-                return Vec3(
-                    x=p1.x + t * (p2.x - p1.x),
-                    y=p1.y + t * (p2.y - p1.y),
-                    z=p1.z + t * (p2.z - p1.z),
-                )
-
-        # Fallback to last point
-        return Vec3(x=trajectory[-1].x, y=trajectory[-1].y, z=trajectory[-1].z)
+        # Bisect for the first segment whose end is at or after time. Time is
+        # strictly inside the trajectory here, so 0 <= i < len - 1.
+        if times is None:
+            i = bisect_left(trajectory, time, key=_point_time) - 1
+        else:
+            i = bisect_left(times, time) - 1
+        return _lerp(trajectory[i], trajectory[i + 1], time)
 
     def get_phase_at_time(self, time: float) -> Phase:
         """Get the ball phase at a specific time.
@@ -234,11 +281,8 @@ class BallAnimator:
             return Phase.STOPPED
 
         # Find the point at or just before the given time
-        for i in range(len(self.trajectory) - 1, -1, -1):
-            if self.trajectory[i].t <= time:
-                return self.trajectory[i].phase
-
-        return self.trajectory[0].phase
+        i = bisect_right(self._times, time) - 1
+        return self.trajectory[max(i, 0)].phase
 
     def get_position_at_time(self, time: float) -> Vec3:
         """Get the ball position at a specific time.
@@ -249,7 +293,7 @@ class BallAnimator:
         Returns:
             Position at the given time.
         """
-        return self._interpolate_position(self.trajectory, time)
+        return self._interpolate_position(self.trajectory, time, self._times)
 
     async def animate_shot(
         self,
@@ -306,11 +350,19 @@ class BallAnimator:
 
         # Set initial tee box camera
         if scene is not None:
-            tee_cam_pos, tee_cam_look = get_tee_box_camera()
-            scene.update_camera(tee_cam_pos, tee_cam_look)
+            scene.update_camera(*_TEE_BOX_CAMERA)
 
         last_phase = Phase.FLIGHT
 
+        # Resolve per-shot lookups once rather than on every frame
+        from gc2_connect.open_range.visualization.range_scene import (
+            SCENE_UNITS_PER_FOOT,
+            SCENE_UNITS_PER_YARD,
+        )
+
+        frame_count = len(frames)
+        phase_at = self.get_phase_at_time
+
         for i, frame_pos in enumerate(frames):
             if not self.is_animating:
                 break
@@ -318,10 +370,10 @@ class BallAnimator:
             self.current_frame = i
 
             # Calculate time at this frame
-            frame_time = (i / len(frames)) * total_time
+            frame_time = (i / frame_count) * total_time
 
             # Get phase at this time
-            current_phase = self.get_phase_at_time(frame_time)
+            current_phase = phase_at(frame_time)
             self.current_phase = current_phase
 
             # Notify phase change
@@ -332,19 +384,14 @@ class BallAnimator:
 
             # Update scene
             if scene is not None:
-                from gc2_connect.open_range.visualization.range_scene import (
-                    feet_to_scene,
-                    yards_to_scene,
-                )
-
                 # Convert physics coordinates to scene coordinates:
                 # Physics X (forward) -> Scene Z
                 # Physics Y (height) -> Scene Y
                 # Physics Z (lateral) -> Scene X (negated: physics +Z is right, scene -X is right)
                 scene_pos = Vec3(
-                    x=-yards_to_scene(frame_pos.z),  # Physics lateral -> Scene X (negated)
-                    y=feet_to_scene(frame_pos.y),  # Height stays Y
-                    z=yards_to_scene(frame_pos.x),  # Physics forward -> Scene Z
+                    x=-(frame_pos.z * SCENE_UNITS_PER_YARD),  # Physics lateral -> Scene X (negated)
+                    y=frame_pos.y * SCENE_UNITS_PER_FOOT,  # Height stays Y
+                    z=frame_pos.x * SCENE_UNITS_PER_YARD,  # Physics forward -> Scene Z
                 )
                 scene.update_ball_position(scene_pos)
 
@@ -367,8 +414,7 @@ class BallAnimator:
             await asyncio.sleep(CAMERA_END_DELAY / speed)
 
             # Reset camera to tee box view
-            tee_cam_pos, tee_cam_look = get_tee_box_camera()
-            scene.update_camera(tee_cam_pos, tee_cam_look)
+            scene.update_camera(*_TEE_BOX_CAMERA)
 
         self.is_animating = False
         self.current_phase = Phase.STOPPED
@@ -22,6 +22,8 @@ Physics coordinate mapping:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from gc2_connect.open_range.models import Phase, TrajectoryPoint, Vec3
@@ -36,16 +38,19 @@ RANGE_LENGTH_YARDS: int = 400
 RANGE_WIDTH_YARDS: int = 100
 
 # Distance markers (yards)
-DISTANCE_MARKERS: list[int] = [50, 100, 150, 200, 250, 300, 350]
-
-# Target greens configuration: distance and radius in yards
-TARGET_GREENS: list[dict[str, float]] = [
-    {"distance": 75.0, "radius": 8.0},
-    {"distance": 125.0, "radius": 10.0},
-    {"distance": 175.0, "radius": 12.0},
-    {"distance": 225.0, "radius": 12.0},
-    {"distance": 275.0, "radius": 15.0},
-]
+DISTANCE_MARKERS: tuple[int, ...] = (50, 100, 150, 200, 250, 300, 350)
+
+# Target greens configuration: distance and radius in yards (read-only)
+TARGET_GREENS: tuple[Mapping[str, float], ...] = tuple(
+    MappingProxyType({"distance": distance, "radius": radius})
+    for distance, radius in (
+        (75.0, 8.0),
+        (125.0, 10.0),
+        (175.0, 12.0),
+        (225.0, 12.0),
+        (275.0, 15.0),
+    )
+)
 
 # Lighting configuration
 AMBIENT_LIGHT_INTENSITY: float = 0.5
@@ -94,6 +99,9 @@ FAIRWAY_STRIPE_DARK: str = "#3d8c40"  # Darker stripe for mowing pattern
 SCENE_SCALE: float = 1.0
 # Feet to yards conversion
 FEET_PER_YARD: float = 3.0
+# Folded conversion factors, so bulk conversions are a single multiply
+SCENE_UNITS_PER_YARD: float = SCENE_SCALE
+SCENE_UNITS_PER_FOOT: float = SCENE_SCALE / FEET_PER_YARD
 
 
 def yards_to_scene(yards: float) -> float:
@@ -105,7 +113,7 @@ def yards_to_scene(yards: float) -> float:
     Returns:
         Distance in scene units.
     """
-    return yards * SCENE_SCALE
+    return yards * SCENE_UNITS_PER_YARD
 
 
 def feet_to_scene(feet: float) -> float:
@@ -117,7 +125,7 @@ def feet_to_scene(feet: float) -> float:
     Returns:
         Distance in scene units.
     """
-    return (feet / FEET_PER_YARD) * SCENE_SCALE
+    return feet * SCENE_UNITS_PER_FOOT
 
 
 def trajectory_to_scene_coords(trajectory: list[TrajectoryPoint]) -> list[Vec3]:
@@ -134,11 +142,15 @@ def trajectory_to_scene_coords(trajectory: list[TrajectoryPoint]) -> list[Vec3]:
     Returns:
         List of Vec3 positions in scene coordinates (X=lateral, Y=height, Z=forward).
     """
+    # Same arithmetic as yards_to_scene/feet_to_scene, inlined so a long
+    # trajectory doesn't pay three function calls per point
+    per_yard = SCENE_UNITS_PER_YARD
+    per_foot = SCENE_UNITS_PER_FOOT
     return [
         Vec3(
-            x=-yards_to_scene(point.z),  # Physics lateral -> Scene X (negated)
-            y=feet_to_scene(point.y),  # Height stays Y
-            z=yards_to_scene(point.x),  # Physics forward -> Scene Z
+            x=-(point.z * per_yard),  # Physics lateral -> Scene X (negated)
+            y=point.y * per_foot,  # Height stays Y
+            z=point.x * per_yard,  # Physics forward -> Scene Z
         )
         for point in trajectory
     ]
@@ -566,9 +578,7 @@ class RangeScene:
         self.trajectory_trace.add_point(position, phase)
 
         # Draw the new segment if one was created
-        if self.trajectory_trace.segments:
-            latest_segment = self.trajectory_trace.segments[-1]
-            self.trajectory_trace.draw_segment_in_scene(self.scene, latest_segment)
+        self.trajectory_trace.draw_in_scene(self.scene)
 
     def clear_trajectory_line(self) -> None:
         """Remove the current trajectory line from scene."""
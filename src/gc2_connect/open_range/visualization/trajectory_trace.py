@@ -5,6 +5,7 @@
 This module provides:
 - TrajectoryTrace: Manages collection of trace segments
 - TraceSegment: Individual line segment with phase-based coloring
+- SegmentView: Read-only sequence of TraceSegments over a trace's storage
 - get_phase_color: Returns appropriate color for each phase
 
 Trace colors by phase:
@@ -20,8 +21,10 @@ visible after the animation completes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, overload
 
 from gc2_connect.open_range.models import Phase, Vec3
 
@@ -30,12 +33,17 @@ if TYPE_CHECKING:
 
 
 # Phase colors (match ball_animation.py colors)
-TRACE_COLORS: dict[Phase, str] = {
-    Phase.FLIGHT: "#00ff88",  # Green - ball in flight
-    Phase.BOUNCE: "#ff8844",  # Orange - ground contact
-    Phase.ROLLING: "#00d4ff",  # Blue - rolling
-    Phase.STOPPED: "#888888",  # Gray - at rest
-}
+TRACE_COLORS: Mapping[Phase, str] = MappingProxyType(
+    {
+        Phase.FLIGHT: "#00ff88",  # Green - ball in flight
+        Phase.BOUNCE: "#ff8844",  # Orange - ground contact
+        Phase.ROLLING: "#00d4ff",  # Blue - rolling
+        Phase.STOPPED: "#888888",  # Gray - at rest
+    }
+)
+
+# Color for anything without an entry above, resolved once at import
+_DEFAULT_TRACE_COLOR: str = TRACE_COLORS[Phase.STOPPED]
 
 # Default maximum segments to prevent memory issues
 DEFAULT_MAX_SEGMENTS: int = 500
@@ -54,7 +62,15 @@ def get_phase_color(phase: Phase) -> str:
     Returns:
         Hex color string for the phase.
     """
-    return TRACE_COLORS.get(phase, TRACE_COLORS[Phase.STOPPED])
+    return TRACE_COLORS.get(phase, _DEFAULT_TRACE_COLOR)
+
+
+def _delete_scene_object(obj: Any) -> None:
+    """Remove a drawn object from its scene, ignoring already-gone objects."""
+    try:
+        obj.delete()
+    except Exception:
+        pass
 
 
 @dataclass
@@ -76,7 +92,54 @@ class TraceSegment:
         return get_phase_color(self.phase)
 
 
-@dataclass
+class SegmentView(Sequence[TraceSegment]):
+    """Read-only sequence view over a TrajectoryTrace's segments.
+
+    Items are the TraceSegment objects the trace stores, oldest first.
+    The view itself is live: it always reflects the trace's current
+    contents.
+    """
+
+    __slots__ = ("_trace",)
+
+    def __init__(self, trace: TrajectoryTrace) -> None:
+        self._trace = trace
+
+    def __len__(self) -> int:
+        return self._trace._count
+
+    @overload
+    def __getitem__(self, index: int) -> TraceSegment: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TraceSegment]: ...
+
+    def __getitem__(self, index: int | slice) -> TraceSegment | list[TraceSegment]:
+        count = self._trace._count
+        if isinstance(index, slice):
+            return [self._trace._segment_at(i) for i in range(*index.indices(count))]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("segment index out of range")
+        return self._trace._segment_at(index)
+
+    def __iter__(self) -> Iterator[TraceSegment]:
+        segment_at = self._trace._segment_at
+        for i in range(self._trace._count):
+            yield segment_at(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SegmentView({list(self)!r})"
+
+
 class TrajectoryTrace:
     """Manages trajectory trace visualization.
 
@@ -84,6 +147,13 @@ class TrajectoryTrace:
     to draw them in the scene. Supports both batch building from
     a full trajectory and progressive point-by-point addition.
 
+    Segments are kept in a ring buffer preallocated to max_segments:
+    once it is full, each new segment replaces the oldest one (and
+    removes its breadcrumb), so the trace holds the most recent path.
+    The segments property exposes them, oldest first. Assigning
+    max_segments reallocates the ring, keeping the newest segments
+    that fit.
+
     The trace uses small spheres as "breadcrumbs" along the path
     since NiceGUI's scene doesn't have a direct line API.
 
@@ -96,25 +166,117 @@ class TrajectoryTrace:
         trace.build_from_trajectory(trajectory_points)
     """
 
-    max_segments: int = DEFAULT_MAX_SEGMENTS
-    segments: list[TraceSegment] = field(default_factory=list)
-    visible: bool = True
-    _last_point: Vec3 | None = None
-    _scene_objects: list[Any] = field(default_factory=list)
+    def __init__(
+        self,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        segments: Iterable[TraceSegment] | None = None,
+        visible: bool = True,
+    ) -> None:
+        """Initialize a trace, optionally preloaded with segments.
+
+        Args:
+            max_segments: Most segments kept; older ones are dropped.
+            segments: Initial segments, oldest first. Only the newest
+                max_segments are kept.
+            visible: Whether the trace is drawn.
+        """
+        self.visible = visible
+        self._last_point: Vec3 | None = None
+        # Spheres drawn by draw_segment_in_scene, keyed by id
+        self._scene_objects: dict[int, Any] = {}
+        self._allocate(max_segments)
+        if segments is not None:
+            self._load(segments)
+
+    def __repr__(self) -> str:
+        return (
+            f"TrajectoryTrace(max_segments={self._max_segments!r}, "
+            f"visible={self.visible!r}, segments={len(self.segments)})"
+        )
+
+    def _allocate(self, max_segments: int) -> None:
+        """Replace segment storage with an empty ring of max_segments slots."""
+        self._max_segments = max_segments
+        self._ring: list[TraceSegment | None] = [None] * max(max_segments, 0)
+        # Segments ever added since the last clear; segment k lives in slot
+        # k % max_segments while it is one of the newest _count
+        self._head = 0
+        self._count = 0
+        self._drawn = 0  # Segments before this have been through draw_in_scene
+
+    def _load(self, segments: Iterable[TraceSegment]) -> None:
+        """Append segments, removing breadcrumbs of any that do not fit."""
+        for segment in segments:
+            self._append(segment)
+
+    def _append(self, segment: TraceSegment) -> None:
+        """Store segment in the next ring slot, evicting the oldest if full."""
+        capacity = self._max_segments
+        if capacity <= 0:
+            self._remove_breadcrumb(segment)
+            return
+
+        slot = self._head % capacity
+        # Remove the breadcrumb of the segment being overwritten, if any
+        evicted = self._ring[slot]
+        if evicted is not None:
+            self._remove_breadcrumb(evicted)
+        self._ring[slot] = segment
+
+        self._head += 1
+        if self._count < capacity:
+            self._count += 1
+
+    def _remove_breadcrumb(self, segment: TraceSegment) -> None:
+        """Delete segment's sphere, if drawn, and stop tracking it."""
+        obj = segment.scene_object
+        if obj is not None:
+            segment.scene_object = None
+            self._scene_objects.pop(id(obj), None)
+            _delete_scene_object(obj)
+
+    @property
+    def max_segments(self) -> int:
+        """Most segments the trace keeps."""
+        return self._max_segments
+
+    @max_segments.setter
+    def max_segments(self, value: int) -> None:
+        """Resize storage, keeping the newest segments that still fit.
+
+        Breadcrumbs of segments that no longer fit are removed.
+
+        Args:
+            value: New segment limit.
+        """
+        kept = list(self.segments)
+        self._allocate(value)
+        self._load(kept)
+
+    @property
+    def segments(self) -> SegmentView:
+        """Segments added so far, in order."""
+        return SegmentView(self)
+
+    def _segment_at(self, index: int) -> TraceSegment:
+        """Return the index-th oldest stored segment."""
+        segment = self._ring[(self._head - self._count + index) % self._max_segments]
+        assert segment is not None
+        return segment
 
     def add_segment(self, start: Vec3, end: Vec3, phase: Phase) -> None:
         """Add a segment to the trace.
 
+        When the trace already holds max_segments segments, the oldest
+        one is dropped to make room.
+
         Args:
             start: Start position in scene coordinates.
             end: End position in scene coordinates.
             phase: Phase of this segment (determines color).
         """
-        if len(self.segments) >= self.max_segments:
-            return
-
-        segment = TraceSegment(start=start, end=end, phase=phase)
-        self.segments.append(segment)
+        if self._max_segments > 0:
+            self._append(TraceSegment(start=start, end=end, phase=phase))
 
     def add_point(self, position: Vec3, phase: Phase) -> None:
         """Add a point progressively during animation.
@@ -129,6 +291,7 @@ class TrajectoryTrace:
         if self._last_point is not None:
             self.add_segment(self._last_point, position, phase)
 
+        # Vec3 is frozen, so keeping the caller's instance needs no copy
         self._last_point = position
 
     def build_from_trajectory(
@@ -146,8 +309,8 @@ class TrajectoryTrace:
             sample_interval: Sample every Nth point (default 1 = all points).
         """
         from gc2_connect.open_range.visualization.range_scene import (
-            feet_to_scene,
-            yards_to_scene,
+            SCENE_UNITS_PER_FOOT,
+            SCENE_UNITS_PER_YARD,
         )
 
         self.clear()
@@ -158,43 +321,47 @@ class TrajectoryTrace:
         # Sample points based on interval
         sampled = trajectory[::sample_interval]
         # Ensure last point is included
-        if trajectory[-1] not in sampled:
+        if (len(trajectory) - 1) % sample_interval:
             sampled.append(trajectory[-1])
 
-        # Convert to scene coordinates and create segments
-        for i in range(len(sampled) - 1):
-            p1 = sampled[i]
-            p2 = sampled[i + 1]
-
-            # Convert physics coords to scene coords
-            # Physics X (forward) -> Scene Z
-            # Physics Y (height) -> Scene Y
-            # Physics Z (lateral) -> Scene X (negated)
-            start = Vec3(
-                x=-yards_to_scene(p1.z),
-                y=feet_to_scene(p1.y),
-                z=yards_to_scene(p1.x),
-            )
-            end = Vec3(
-                x=-yards_to_scene(p2.z),
-                y=feet_to_scene(p2.y),
-                z=yards_to_scene(p2.x),
-            )
-
-            # Use the end point's phase for the segment
-            self.add_segment(start, end, p2.phase)
+        # Keep the most recent segments, as progressive adds would
+        count = min(len(sampled) - 1, self._max_segments)
+        if count <= 0:
+            return
+        sampled = sampled[-(count + 1) :]
+
+        # Convert every point to scene coords once, so adjacent segments
+        # share their Vec3 (same arithmetic as yards_to_scene/feet_to_scene):
+        # Physics X (forward) -> Scene Z
+        # Physics Y (height) -> Scene Y
+        # Physics Z (lateral) -> Scene X (negated)
+        per_yard = SCENE_UNITS_PER_YARD
+        per_foot = SCENE_UNITS_PER_FOOT
+        positions = [Vec3(x=-(p.z * per_yard), y=p.y * per_foot, z=p.x * per_yard) for p in sampled]
+
+        # Segment i runs from point i to point i + 1, using the end point's phase
+        self._ring[:count] = [
+            TraceSegment(start=start, end=end, phase=p.phase)
+            for start, end, p in zip(positions, positions[1:], sampled[1:], strict=False)
+        ]
+        self._head = count
+        self._count = count
 
     def clear(self) -> None:
         """Clear all trace segments and remove from scene."""
-        # Remove scene objects
-        for obj in self._scene_objects:
-            try:
-                obj.delete()
-            except Exception:
-                pass
-
-        self.segments = []
-        self._scene_objects = []
+        # Remove scene objects, once each
+        objects = self._scene_objects
+        for segment in self._ring:
+            if segment is not None and segment.scene_object is not None:
+                objects[id(segment.scene_object)] = segment.scene_object
+        for obj in objects.values():
+            _delete_scene_object(obj)
+
+        self._ring[:] = [None] * len(self._ring)
+        self._head = 0
+        self._count = 0
+        self._drawn = 0
+        self._scene_objects = {}
         self._last_point = None
 
     def set_visible(self, visible: bool) -> None:
@@ -210,7 +377,9 @@ class TrajectoryTrace:
 
         Uses small spheres as "breadcrumbs" to visualize the path.
         This approach works with NiceGUI's scene API which doesn't
-        have a direct line primitive.
+        have a direct line primitive. Segments drawn by an earlier
+        call are skipped, so calling this after each new point only
+        draws the new segments.
 
         Args:
             scene: NiceGUI scene to draw in.
@@ -221,19 +390,24 @@ class TrajectoryTrace:
         try:
             from nicegui import ui
 
+            ring = self._ring
+            color_of = TRACE_COLORS.get
+            capacity = self._max_segments
+            # Segments evicted before they were drawn are skipped
+            first = max(self._drawn, self._head - self._count)
             with scene:
-                for segment in self.segments:
-                    if segment.scene_object is not None:
-                        continue
-
-                    # Draw a small sphere at the end point of each segment
-                    sphere = (
-                        ui.scene.sphere(radius=TRACE_SPHERE_RADIUS)
-                        .material(segment.color)
-                        .move(segment.end.x, segment.end.y, segment.end.z)
-                    )
-                    segment.scene_object = sphere
-                    self._scene_objects.append(sphere)
+                for k in range(first, self._head):
+                    segment = ring[k % capacity]
+                    # Draw a small sphere at the end point of each segment,
+                    # unless it was already drawn on its own
+                    if segment is not None and segment.scene_object is None:
+                        end = segment.end
+                        segment.scene_object = (
+                            ui.scene.sphere(radius=TRACE_SPHERE_RADIUS)
+                            .material(color_of(segment.phase, _DEFAULT_TRACE_COLOR))
+                            .move(end.x, end.y, end.z)
+                        )
+                    self._drawn = k + 1
         except ImportError:
             pass
 
@@ -260,6 +434,6 @@ class TrajectoryTrace:
                     .move(segment.end.x, segment.end.y, segment.end.z)
                 )
                 segment.scene_object = sphere
-                self._scene_objects.append(sphere)
+                self._scene_objects[id(sphere)] = sphere
         except ImportError:
             pass
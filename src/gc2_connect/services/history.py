@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+from itertools import islice
 from typing import Any
 
 from gc2_connect.models import GC2ShotData
@@ -24,10 +26,31 @@ class ShotHistoryManager:
         """Initialize the shot history manager.
 
         Args:
-            limit: Maximum number of shots to keep in history.
+            limit: Maximum number of shots to keep in history. Negative
+                values are treated as 0 (keep nothing).
         """
+        limit = max(limit, 0)
         self._limit = limit
-        self._shots: list[GC2ShotData] = []
+        # Newest first; maxlen drops the oldest shot on appendleft
+        self._shots: deque[GC2ShotData] = deque(maxlen=limit)
+        # Export rows parallel to _shots, built on first export of each shot
+        self._rows: deque[dict[str, Any] | None] = deque(maxlen=limit)
+        # Per-field float columns parallel to _shots, so rescans run over
+        # plain floats instead of shot attributes
+        self._ball_speeds: deque[float] = deque(maxlen=limit)
+        self._launch_angles: deque[float] = deque(maxlen=limit)
+        self._total_spins: deque[float] = deque(maxlen=limit)
+
+        # Running totals so get_statistics() doesn't rescan the history
+        self._sum_ball_speed = 0.0
+        self._sum_launch_angle = 0.0
+        self._sum_total_spin = 0.0
+        self._max_ball_speed = 0.0
+        self._max_total_spin = 0.0
+        # Set when an evicted shot held a max; rescanned on next read
+        self._max_stale = False
+        # Last (count, limit, text) from format_count_display()
+        self._count_display: tuple[int, int, str] | None = None
 
     @property
     def limit(self) -> int:
@@ -39,9 +62,9 @@ class ShotHistoryManager:
         """Set the history limit and trim if necessary.
 
         Args:
-            value: New limit value.
+            value: New limit value. Negative values are treated as 0.
         """
-        self._limit = value
+        self._limit = max(value, 0)
         self._trim_to_limit()
 
     @property
@@ -51,8 +74,8 @@ class ShotHistoryManager:
 
     @property
     def shots(self) -> list[GC2ShotData]:
-        """Get the list of shots (newest first)."""
-        return self._shots
+        """Get a snapshot list of shots (newest first)."""
+        return list(self._shots)
 
     def add_shot(self, shot: GC2ShotData) -> None:
         """Add a shot to the history.
@@ -63,17 +86,79 @@ class ShotHistoryManager:
         Args:
             shot: The shot data to add.
         """
-        self._shots.insert(0, shot)
-        self._trim_to_limit()
+        if self._limit <= 0:
+            return
+
+        shots = self._shots
+        if len(shots) == self._limit:
+            # appendleft will drop the oldest shot; take it out of the totals
+            evicted_ball_speed = self._ball_speeds[-1]
+            evicted_total_spin = self._total_spins[-1]
+            self._sum_ball_speed -= evicted_ball_speed
+            self._sum_launch_angle -= self._launch_angles[-1]
+            self._sum_total_spin -= evicted_total_spin
+            if (
+                evicted_ball_speed >= self._max_ball_speed
+                or evicted_total_spin >= self._max_total_spin
+            ):
+                self._max_stale = True
+
+        shots.appendleft(shot)
+        self._rows.appendleft(None)
+        self._ball_speeds.appendleft(shot.ball_speed)
+        self._launch_angles.appendleft(shot.launch_angle)
+        self._total_spins.appendleft(shot.total_spin)
+        self._sum_ball_speed += shot.ball_speed
+        self._sum_launch_angle += shot.launch_angle
+        self._sum_total_spin += shot.total_spin
+        if len(shots) == 1:
+            self._max_ball_speed = shot.ball_speed
+            self._max_total_spin = shot.total_spin
+            self._max_stale = False
+        elif not self._max_stale:
+            if shot.ball_speed > self._max_ball_speed:
+                self._max_ball_speed = shot.ball_speed
+            if shot.total_spin > self._max_total_spin:
+                self._max_total_spin = shot.total_spin
 
     def clear(self) -> None:
         """Clear all shots from history."""
-        self._shots.clear()
+        for column in self._columns():
+            column.clear()
+        self._recompute_totals()
 
     def _trim_to_limit(self) -> None:
-        """Trim the history to the current limit."""
-        if len(self._shots) > self._limit:
-            self._shots = self._shots[: self._limit]
+        """Rebuild storage for the current limit, keeping the newest shots."""
+        limit = self._limit
+        self._shots = deque(islice(self._shots, limit), maxlen=limit)
+        self._rows = deque(islice(self._rows, limit), maxlen=limit)
+        self._ball_speeds = deque(islice(self._ball_speeds, limit), maxlen=limit)
+        self._launch_angles = deque(islice(self._launch_angles, limit), maxlen=limit)
+        self._total_spins = deque(islice(self._total_spins, limit), maxlen=limit)
+        self._recompute_totals()
+
+    def _columns(self) -> tuple[deque[Any], ...]:
+        """Return every deque kept parallel to the shots."""
+        return (
+            self._shots,
+            self._rows,
+            self._ball_speeds,
+            self._launch_angles,
+            self._total_spins,
+        )
+
+    def _recompute_totals(self) -> None:
+        """Rebuild the running sums and maxima from the stored columns."""
+        self._sum_ball_speed = sum(self._ball_speeds)
+        self._sum_launch_angle = sum(self._launch_angles)
+        self._sum_total_spin = sum(self._total_spins)
+        self._refresh_max()
+
+    def _refresh_max(self) -> None:
+        """Rescan the stored columns for the max values."""
+        self._max_ball_speed = max(self._ball_speeds, default=0.0)
+        self._max_total_spin = max(self._total_spins, default=0.0)
+        self._max_stale = False
 
     def get_statistics(self) -> dict[str, float | int]:
         """Calculate session statistics from the shot history.
@@ -91,60 +176,39 @@ class ShotHistoryManager:
                 "max_total_spin": 0.0,
             }
 
-        count = len(self._shots)
-        total_ball_speed = sum(s.ball_speed for s in self._shots)
-        total_launch_angle = sum(s.launch_angle for s in self._shots)
-        total_spin = sum(s.total_spin for s in self._shots)
-
-        max_ball_speed = max(s.ball_speed for s in self._shots)
-        max_total_spin = max(s.total_spin for s in self._shots)
+        if self._max_stale:
+            self._refresh_max()
 
+        count = len(self._shots)
         return {
             "count": count,
-            "avg_ball_speed": total_ball_speed / count,
-            "avg_launch_angle": total_launch_angle / count,
-            "avg_total_spin": total_spin / count,
-            "max_ball_speed": max_ball_speed,
-            "max_total_spin": max_total_spin,
+            "avg_ball_speed": self._sum_ball_speed / count,
+            "avg_launch_angle": self._sum_launch_angle / count,
+            "avg_total_spin": self._sum_total_spin / count,
+            "max_ball_speed": self._max_ball_speed,
+            "max_total_spin": self._max_total_spin,
         }
 
     def to_dict_list(self) -> list[dict[str, Any]]:
         """Export shots as a list of dictionaries.
 
+        Each shot's row is built once and reused by later exports; stored
+        shots are treated as immutable.
+
         Returns:
             List of dictionaries representing each shot.
         """
-        result = []
-        for shot in self._shots:
-            shot_dict: dict[str, Any] = {
-                "shot_id": shot.shot_id,
-                "timestamp": shot.timestamp.isoformat(),
-                "ball_speed": shot.ball_speed,
-                "launch_angle": shot.launch_angle,
-                "horizontal_launch_angle": shot.horizontal_launch_angle,
-                "total_spin": shot.total_spin,
-                "back_spin": shot.back_spin,
-                "side_spin": shot.side_spin,
-                "spin_axis": shot.spin_axis,
-            }
-
-            # Include club data if present
-            if shot.club_speed is not None:
-                shot_dict["club_speed"] = shot.club_speed
-            if shot.swing_path is not None:
-                shot_dict["swing_path"] = shot.swing_path
-            if shot.face_to_target is not None:
-                shot_dict["face_to_target"] = shot.face_to_target
-            if shot.angle_of_attack is not None:
-                shot_dict["angle_of_attack"] = shot.angle_of_attack
-            if shot.lie is not None:
-                shot_dict["lie"] = shot.lie
-            if shot.dynamic_loft is not None:
-                shot_dict["dynamic_loft"] = shot.dynamic_loft
-
-            result.append(shot_dict)
-
-        return result
+        rows = self._rows
+        if None in rows:
+            self._rows = rows = deque(
+                (
+                    row if row is not None else _shot_to_dict(shot)
+                    for shot, row in zip(self._shots, rows, strict=True)
+                ),
+                maxlen=self._limit,
+            )
+        # Copies, so callers can't edit the cached rows
+        return [row.copy() for row in rows if row is not None]
 
     def format_count_display(self) -> str:
         """Format the count display string.
@@ -152,4 +216,49 @@ class ShotHistoryManager:
         Returns:
             String in format "Shots: X/Y" where X is count and Y is limit.
         """
-        return f"Shots: {self.count}/{self.limit}"
+        count = len(self._shots)
+        limit = self._limit
+        cached = self._count_display
+        if cached is not None and cached[0] == count and cached[1] == limit:
+            return cached[2]
+        text = f"Shots: {count}/{limit}"
+        self._count_display = (count, limit, text)
+        return text
+
+
+def _shot_to_dict(shot: GC2ShotData) -> dict[str, Any]:
+    """Build the export dictionary for one shot.
+
+    Args:
+        shot: The shot to export.
+
+    Returns:
+        Dictionary of ball data, plus any club data present.
+    """
+    shot_dict: dict[str, Any] = {
+        "shot_id": shot.shot_id,
+        "timestamp": shot.timestamp.isoformat(),
+        "ball_speed": shot.ball_speed,
+        "launch_angle": shot.launch_angle,
+        "horizontal_launch_angle": shot.horizontal_launch_angle,
+        "total_spin": shot.total_spin,
+        "back_spin": shot.back_spin,
+        "side_spin": shot.side_spin,
+        "spin_axis": shot.spin_axis,
+    }
+
+    # Include club data if present
+    if shot.club_speed is not None:
+        shot_dict["club_speed"] = shot.club_speed
+    if shot.swing_path is not None:
+        shot_dict["swing_path"] = shot.swing_path
+    if shot.face_to_target is not None:
+        shot_dict["face_to_target"] = shot.face_to_target
+    if shot.angle_of_attack is not None:
+        shot_dict["angle_of_attack"] = shot.angle_of_attack
+    if shot.lie is not None:
+        shot_dict["lie"] = shot.lie
+    if shot.dynamic_loft is not None:
+        shot_dict["dynamic_loft"] = shot.dynamic_loft
+
+    return shot_dict
@@ -14,7 +14,8 @@ from typing import Any
 
 from nicegui import app, ui
 
-from gc2_connect.config.settings import Settings, get_settings_path
+from gc2_connect.config.settings import Settings
+from gc2_connect.config.settings_path import get_settings_path
 from gc2_connect.gc2.usb_reader import GC2USBReader, MockGC2Reader
 from gc2_connect.gspro.client import GSProClient
 from gc2_connect.models import GC2BallStatus, GC2ShotData
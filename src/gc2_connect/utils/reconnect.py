@@ -38,6 +38,19 @@ class ReconnectionManager:
     - Works with both sync and async connect functions
     """
 
+    __slots__ = (
+        "max_retries",
+        "_base_delay",
+        "_max_delay",
+        "_delay_table",
+        "_state",
+        "_retry_count",
+        "_cancelled",
+        "_cancel_event",
+        "_state_callbacks",
+        "_attempt_callbacks",
+    )
+
     def __init__(
         self,
         max_retries: int = 5,
@@ -52,17 +65,43 @@ class ReconnectionManager:
             max_delay: Maximum delay between retries in seconds
         """
         self.max_retries = max_retries
-        self.base_delay = base_delay
-        self.max_delay = max_delay
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._delay_table: list[float] = []
+        self._build_delay_table()
 
         self._state = ReconnectionState.DISCONNECTED
         self._retry_count = 0
         self._cancelled = False
+        # Set by cancel() to wake a backoff wait early
+        self._cancel_event = asyncio.Event()
 
         # Callbacks
         self._state_callbacks: list[Callable[[ReconnectionState], None]] = []
         self._attempt_callbacks: list[Callable[[int, float], None]] = []
 
+    @property
+    def base_delay(self) -> float:
+        """Initial delay between retries in seconds."""
+        return self._base_delay
+
+    @base_delay.setter
+    def base_delay(self, value: float) -> None:
+        """Set the initial delay and rebuild the backoff table."""
+        self._base_delay = value
+        self._build_delay_table()
+
+    @property
+    def max_delay(self) -> float:
+        """Maximum delay between retries in seconds."""
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, value: float) -> None:
+        """Set the delay cap and rebuild the backoff table."""
+        self._max_delay = value
+        self._build_delay_table()
+
     @property
     def state(self) -> ReconnectionState:
         """Current reconnection state."""
@@ -87,8 +126,22 @@ class ReconnectionManager:
         Returns:
             Delay in seconds, capped at max_delay
         """
-        delay = self.base_delay * (2**attempt)
-        return float(min(delay, self.max_delay))
+        if 0 <= attempt < len(self._delay_table):
+            return self._delay_table[attempt]
+        return self._compute_delay(attempt)
+
+    def _compute_delay(self, attempt: int) -> float:
+        """Compute the capped exponential backoff delay for one attempt."""
+        delay = self._base_delay * (2**attempt)
+        return float(min(delay, self._max_delay))
+
+    def _build_delay_table(self) -> None:
+        """Precompute delays for the attempts a default run will make.
+
+        Attempts past the table (e.g. after max_retries is raised) fall back
+        to computing the delay directly.
+        """
+        self._delay_table = [self._compute_delay(attempt) for attempt in range(self.max_retries)]
 
     def on_state_change(self, callback: Callable[[ReconnectionState], None]) -> None:
         """Register a callback for state changes.
@@ -140,6 +193,7 @@ class ReconnectionManager:
             True if connection succeeded, False if all retries exhausted
         """
         self._cancelled = False
+        self._cancel_event.clear()
         self._retry_count = 0
         self._set_state(ReconnectionState.CONNECTING)
 
@@ -174,7 +228,7 @@ class ReconnectionManager:
                 )
 
                 try:
-                    await asyncio.sleep(delay)
+                    await self._wait_backoff(delay)
                 except asyncio.CancelledError:
                     self._cancelled = True
                     break
@@ -188,9 +242,21 @@ class ReconnectionManager:
         logger.error(f"Reconnection failed after {self.max_retries} attempts")
         return False
 
+    async def _wait_backoff(self, delay: float) -> None:
+        """Wait out a backoff delay, returning early if cancel() is called.
+
+        Args:
+            delay: Maximum time to wait in seconds
+        """
+        try:
+            await asyncio.wait_for(self._cancel_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
     def cancel(self) -> None:
         """Cancel ongoing reconnection attempts."""
         self._cancelled = True
+        self._cancel_event.set()
         if self._state == ReconnectionState.RECONNECTING:
             self._set_state(ReconnectionState.DISCONNECTED)
         logger.info("Reconnection cancelled by user")
@@ -199,4 +265,5 @@ class ReconnectionManager:
         """Reset the manager to initial state."""
         self._retry_count = 0
         self._cancelled = False
+        self._cancel_event.clear()
         self._set_state(ReconnectionState.DISCONNECTED)
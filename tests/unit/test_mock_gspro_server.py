@@ -0,0 +1,155 @@
+# ABOUTME: Unit tests for the mock GSPro server tool's message framing.
+# ABOUTME: Tests finding JSON object boundaries in a TCP stream and the replies sent.
+"""Tests for tools/mock_gspro_server.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_TOOL_PATH = Path(__file__).resolve().parents[2] / "tools" / "mock_gspro_server.py"
+
+
+@pytest.fixture(scope="module")
+def server() -> ModuleType:
+    """Load the mock server script as a module (tools/ isn't a package)."""
+    spec = importlib.util.spec_from_file_location("mock_gspro_server", _TOOL_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ChunkReader:
+    """Stream reader stand-in that returns the given chunks, one per read."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = list(chunks)
+
+    async def read(self, n: int) -> bytes:
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class RecordingWriter:
+    """Stream writer stand-in that records the replies written."""
+
+    def __init__(self) -> None:
+        self.replies: list[dict[str, object]] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.replies.append(json.loads(data))
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def get_extra_info(self, name: str) -> object:
+        return ("127.0.0.1", 50000)
+
+
+async def _reply_codes(server: ModuleType, chunks: list[bytes]) -> list[object]:
+    """Run handle_client over chunks and return the response codes sent."""
+    writer = RecordingWriter()
+    await server.handle_client(ChunkReader(chunks), writer)
+    assert writer.closed
+    return [reply["Code"] for reply in writer.replies]
+
+
+def _shot(number: int) -> bytes:
+    return json.dumps({"ShotNumber": number, "BallData": {"Speed": 150.0}}).encode()
+
+
+class TestFindMessageEnd:
+    """Tests for locating the end of a JSON object."""
+
+    def test_complete_object(self, server: ModuleType) -> None:
+        """Test that the end is just past the closing brace."""
+        buffer = b'{"a": {"b": 1}}'
+        assert server.find_message_end(buffer, 0) == len(buffer)
+
+    def test_incomplete_object(self, server: ModuleType) -> None:
+        """Test that an unfinished object reports -1."""
+        assert server.find_message_end(b'{"a": {"b": 1}', 0) == -1
+
+    def test_merged_objects(self, server: ModuleType) -> None:
+        """Test that only the first of back-to-back objects is matched."""
+        first, second = _shot(1), _shot(2)
+        buffer = first + second
+        end = server.find_message_end(buffer, 0)
+        assert end == len(first)
+        assert server.find_message_end(buffer, end) == len(buffer)
+
+    def test_start_offset(self, server: ModuleType) -> None:
+        """Test that the search starts at the given offset."""
+        buffer = b'  garbage {"a": 1}'
+        start = buffer.index(b"{")
+        assert server.find_message_end(buffer, start) == len(buffer)
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            {"Name": "} closing brace"},
+            {"Name": "{ opening brace"},
+            {"Name": 'escaped "quote" with }'},
+            {"Name": "trailing backslash \\"},
+            {"Name": 'backslash then quote \\" }'},
+            {"Name": "\\\\", "Other": "}{"},
+        ],
+    )
+    def test_strings_do_not_count(self, server: ModuleType, message: dict[str, str]) -> None:
+        """Test that braces, escaped quotes and backslashes in strings are skipped."""
+        buffer = json.dumps(message).encode()
+        assert server.find_message_end(buffer + b"{", 0) == len(buffer)
+
+
+class TestHandleMessage:
+    """Tests for replying to a single message."""
+
+    def test_shot_gets_ok(self, server: ModuleType, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that a shot object is logged and acknowledged."""
+        reply = json.loads(server.handle_message(_shot(7)))
+        assert reply["Code"] == 200
+        assert "Shot #7" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("raw", [b"not json", b"[1, 2]", b'"text"', b"\xff\xfe{"])
+    def test_invalid_message_gets_error(self, server: ModuleType, raw: bytes) -> None:
+        """Test that bad JSON and non-object JSON get the 500 response."""
+        assert json.loads(server.handle_message(raw))["Code"] == 500
+
+
+class TestHandleClient:
+    """Tests for framing messages from a client stream."""
+
+    async def test_split_message(self, server: ModuleType) -> None:
+        """Test that a message split across reads is answered once, when complete."""
+        shot = _shot(1)
+        assert await _reply_codes(server, [shot[:5], shot[5:12], shot[12:]]) == [200]
+
+    async def test_merged_messages(self, server: ModuleType) -> None:
+        """Test that messages arriving in one read each get a reply."""
+        chunks = [_shot(1) + b"\r\n" + _shot(2) + _shot(3)[:4], _shot(3)[4:]]
+        assert await _reply_codes(server, chunks) == [200, 200, 200]
+
+    async def test_garbage_before_object(self, server: ModuleType) -> None:
+        """Test that non-JSON input is answered with an error and dropped."""
+        assert await _reply_codes(server, [b"hello ", _shot(1)]) == [500, 200]
+
+    async def test_message_over_limit_is_dropped(self, server: ModuleType) -> None:
+        """Test that an unfinished message past MAX_MESSAGE_BYTES is abandoned."""
+        oversized = b'{"a": "' + b"x" * server.MAX_MESSAGE_BYTES
+        chunks = [oversized[i : i + 65536] for i in range(0, len(oversized), 65536)]
+        assert await _reply_codes(server, [*chunks, _shot(1)]) == [500, 200]
+
+    async def test_message_at_limit_is_awaited(self, server: ModuleType) -> None:
+        """Test that an unfinished message within MAX_MESSAGE_BYTES is still awaited."""
+        padding = b"x" * (server.MAX_MESSAGE_BYTES - len(b'{"a": "') - 2)
+        message = b'{"a": "' + padding + b'"}'
+        assert len(message) == server.MAX_MESSAGE_BYTES
+        assert await _reply_codes(server, [message[:-1], message[-1:]]) == [200]
@@ -136,6 +136,23 @@ class TestVec3:
         assert result.y == 2.0
         assert result.z == -3.0
 
+    def test_immutable_and_slotted(self) -> None:
+        """Test Vec3 is immutable with no per-instance dict.
+
+        Trace and animation code keep references to caller-supplied vectors
+        instead of copying them, which relies on this.
+        """
+        from dataclasses import FrozenInstanceError
+
+        from gc2_connect.open_range.models import Vec3
+
+        v = Vec3(x=1.0, y=2.0, z=3.0)
+        with pytest.raises(FrozenInstanceError):
+            v.x = 5.0  # type: ignore[misc]
+        assert not hasattr(v, "__dict__")
+        assert v == Vec3(x=1.0, y=2.0, z=3.0)
+        assert hash(v) == hash(Vec3(x=1.0, y=2.0, z=3.0))
+
 
 class TestPhase:
     """Tests for Phase enum."""
@@ -14,6 +14,8 @@ from gc2_connect.open_range.models import Conditions
 from gc2_connect.open_range.physics.engine import PhysicsEngine
 from gc2_connect.open_range.physics.trajectory import FlightSimulator, meters_to_yards
 
+pytestmark = pytest.mark.flight
+
 
 class TestValidationAgainstNathanModel:
     """Validation tests against expected carry distances from Nathan model.
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import math
+import operator
 from typing import TYPE_CHECKING
 
 import pytest
@@ -13,11 +14,97 @@ from gc2_connect.open_range.models import Conditions, Phase, TrajectoryPoint, Ve
 from gc2_connect.open_range.physics.constants import (
     BALL_MASS_KG,
     GRAVITY_MS2,
+    SPIN_DECAY_RATE,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from gc2_connect.open_range.physics.trajectory import FlightSimulator, SimulationState
+
+    Flight = tuple[list[TrajectoryPoint], SimulationState]
+
+
+def _shot(speed: float, vla: float, backspin: float, sidespin: float = 0.0) -> dict[str, float]:
+    """Build simulate_flight keyword arguments for a straight-launched shot."""
+    return {
+        "ball_speed_mph": speed,
+        "vla_deg": vla,
+        "hla_deg": 0.0,
+        "backspin_rpm": backspin,
+        "sidespin_rpm": sidespin,
+    }
+
+
+# Mid-iron reference shot shared by the wind comparisons
+SEVEN_IRON = _shot(120.0, 16.3, 7097.0)
+
+# Every shot flown by the simulator fixtures in this module, by name. Several
+# tests fly the same shot, so results are cached by the flights fixture.
+# Format: name -> (simulator fixture, simulate_flight kwargs)
+SHOT_CATALOG: dict[str, tuple[str, dict[str, float]]] = {
+    "vacuum_lob": ("simulator_vacuum", _shot(100.0, 45.0, 0.0)),
+    "driver": ("simulator", _shot(167.0, 10.9, 2686.0)),
+    "vacuum_driver": ("simulator_vacuum", _shot(167.0, 10.9, 2686.0)),
+    "seven_iron": ("simulator", SEVEN_IRON),
+    "mid": ("simulator", _shot(150.0, 12.0, 3000.0)),
+    "mid_low_spin": ("simulator", _shot(150.0, 12.0, 1000.0)),
+    "mid_high_spin": ("simulator", _shot(150.0, 12.0, 5000.0)),
+    "mid_slice": ("simulator", _shot(150.0, 12.0, 3000.0, 1500.0)),
+    "mid_hook": ("simulator", _shot(150.0, 12.0, 3000.0, -1500.0)),
+    "low_punch": ("simulator", _shot(100.0, 10.0, 2500.0)),
+    "zero_speed": ("simulator", _shot(0.0, 10.0, 2500.0)),
+    "very_fast": ("simulator", _shot(200.0, 10.0, 2000.0)),
+    "extreme_spin": ("simulator", _shot(100.0, 45.0, 15000.0)),
+    "near_vertical": ("simulator", _shot(200.0, 85.0, 1000.0)),
+}
+
+
+# FlightSimulator holds no per-flight state, so read-only tests share one
+# instance per module rather than rebuilding it (and its air density) each time.
+@pytest.fixture(scope="module")
+def simulator() -> FlightSimulator:
+    """Create a simulator with standard conditions."""
     from gc2_connect.open_range.physics.trajectory import FlightSimulator
 
+    conditions = Conditions()  # Default: 70F, sea level, no wind
+    return FlightSimulator(conditions=conditions, dt=0.01)
+
+
+@pytest.fixture(scope="module")
+def simulator_vacuum() -> FlightSimulator:
+    """Create a simulator with near-zero air density (gravity dominates)."""
+    from gc2_connect.open_range.physics.trajectory import FlightSimulator
+
+    conditions = Conditions(elevation_ft=100000.0)  # Very high to get near-zero air density
+    return FlightSimulator(conditions=conditions, dt=0.01)
+
+
+class _FlightCache(dict[str, "Flight"]):
+    """Catalog results, simulated on first lookup and reused afterwards."""
+
+    def __init__(self, simulators: dict[str, FlightSimulator]) -> None:
+        super().__init__()
+        self._simulators = simulators
+
+    def __missing__(self, name: str) -> Flight:
+        simulator_name, shot = SHOT_CATALOG[name]
+        flight = self._simulators[simulator_name].simulate_flight(**shot)
+        self[name] = flight
+        return flight
+
+
+@pytest.fixture(scope="module")
+def flights(simulator: FlightSimulator, simulator_vacuum: FlightSimulator) -> _FlightCache:
+    """Cached (trajectory, final state) per SHOT_CATALOG name; treat as read-only."""
+    return _FlightCache({"simulator": simulator, "simulator_vacuum": simulator_vacuum})
+
+
+@pytest.fixture(scope="module")
+def calm_7iron(flights: _FlightCache) -> SimulationState:
+    """Final state of the reference 7-iron in calm air, shared by the wind tests."""
+    return flights["seven_iron"][1]
+
 
 class TestUnitConversions:
     """Tests for unit conversion helpers."""
@@ -154,14 +241,6 @@ class TestSimulationState:
 class TestFlightSimulator:
     """Tests for the FlightSimulator class."""
 
-    @pytest.fixture
-    def simulator(self) -> FlightSimulator:
-        """Create a simulator with standard conditions."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()  # Default: 70F, sea level, no wind
-        return FlightSimulator(conditions=conditions, dt=0.01)
-
     def test_simulator_initialization(self, simulator: FlightSimulator) -> None:
         """Test simulator initializes with correct air density."""
         from gc2_connect.open_range.physics.constants import STD_AIR_DENSITY
@@ -169,29 +248,30 @@ class TestFlightSimulator:
         assert simulator.air_density == pytest.approx(STD_AIR_DENSITY, rel=0.01)
         assert simulator.dt == 0.01
 
-    def test_gravity_only_trajectory(self) -> None:
+    def test_air_density_reused_for_same_conditions(self) -> None:
+        """Test that simulators with identical conditions share one density lookup."""
+        from gc2_connect.open_range.physics.aerodynamics import calculate_air_density
+        from gc2_connect.open_range.physics.trajectory import (
+            FlightSimulator,
+            _compute_air_density,
+        )
+
+        conditions = Conditions(temp_f=83.0, elevation_ft=1234.0, humidity_pct=37.0)
+        first = FlightSimulator(conditions=conditions)
+        hits_before = _compute_air_density.cache_info().hits
+        second = FlightSimulator(conditions=conditions.model_copy())
+
+        assert _compute_air_density.cache_info().hits == hits_before + 1
+        assert second.air_density == first.air_density
+        assert first.air_density == calculate_air_density(83.0, 1234.0, 37.0)
+
+    def test_gravity_only_trajectory(self, flights: _FlightCache) -> None:
         """Test trajectory with only gravity (no air resistance).
 
         A projectile under gravity only should follow a parabolic path.
         """
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        # Use zero air density to eliminate drag and Magnus effects
-        conditions = Conditions(
-            temp_f=70.0,
-            elevation_ft=100000.0,  # Very high to get near-zero air density
-            humidity_pct=0.0,
-        )
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Launch at 45 degrees - should give maximum range in vacuum
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=100.0,  # 44.7 m/s
-            vla_deg=45.0,
-            hla_deg=0.0,
-            backspin_rpm=0.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["vacuum_lob"]
 
         # Ball should land (y <= 0)
         assert final_state.pos.y <= 0.001  # Near ground
@@ -201,34 +281,12 @@ class TestFlightSimulator:
         expected_time = 2 * v_ms * math.sin(math.radians(45)) / GRAVITY_MS2
         assert final_state.t == pytest.approx(expected_time, rel=0.05)
 
-    def test_drag_reduces_distance(self) -> None:
+    def test_drag_reduces_distance(self, flights: _FlightCache) -> None:
         """Test that drag reduces distance compared to no-drag case."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        # With standard air density (drag active)
-        conditions_normal = Conditions()
-        sim_normal = FlightSimulator(conditions=conditions_normal, dt=0.01)
+        # Driver-like shot: standard air density (drag active) vs near-vacuum
+        _, final_normal = flights["driver"]
 
-        # Near-vacuum conditions (minimal drag)
-        conditions_vacuum = Conditions(elevation_ft=100000.0)
-        sim_vacuum = FlightSimulator(conditions=conditions_vacuum, dt=0.01)
-
-        # Driver-like shot
-        _, final_normal = sim_normal.simulate_flight(
-            ball_speed_mph=167.0,
-            vla_deg=10.9,
-            hla_deg=0.0,
-            backspin_rpm=2686.0,
-            sidespin_rpm=0.0,
-        )
-
-        _, final_vacuum = sim_vacuum.simulate_flight(
-            ball_speed_mph=167.0,
-            vla_deg=10.9,
-            hla_deg=0.0,
-            backspin_rpm=2686.0,
-            sidespin_rpm=0.0,
-        )
+        _, final_vacuum = flights["vacuum_driver"]
 
         # With drag, ball should travel less distance in X
         # (though backspin lift might compensate somewhat)
@@ -236,103 +294,54 @@ class TestFlightSimulator:
         # At minimum, flight time should be different
         assert final_normal.t != final_vacuum.t
 
-    def test_backspin_creates_lift(self) -> None:
+    def test_backspin_creates_lift(self, flights: _FlightCache) -> None:
         """Test that backspin creates lift (higher apex, more carry)."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Low spin shot
-        trajectory_low, _ = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=1000.0,
-            sidespin_rpm=0.0,
-        )
+        _, final_low = flights["mid_low_spin"]
 
         # High spin shot
-        trajectory_high, _ = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=5000.0,
-            sidespin_rpm=0.0,
-        )
-
-        # Find max height for each trajectory
-        max_height_low = max(p.y for p in trajectory_low)
-        max_height_high = max(p.y for p in trajectory_high)
+        _, final_high = flights["mid_high_spin"]
 
         # High spin should have higher apex due to Magnus lift
-        assert max_height_high > max_height_low
+        assert final_high.apex_y > final_low.apex_y
 
-    def test_sidespin_creates_curve(self) -> None:
+    def test_apex_tracked_in_final_state(self, flights: _FlightCache) -> None:
+        """Test that the final state carries the apex of the whole flight."""
+        trajectory, final_state = flights["mid"]
+
+        # Apex is tracked every step, so it is at least the highest sampled point
+        sampled_apex_m = max(p.y for p in trajectory) * 0.3048
+        assert final_state.apex_y >= sampled_apex_m - 1e-9
+        assert final_state.apex_y == pytest.approx(sampled_apex_m, abs=0.05)
+
+    def test_sidespin_creates_curve(self, flights: _FlightCache) -> None:
         """Test that sidespin creates lateral curve.
 
         Positive sidespin = fade/slice (curves right)
         """
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Straight shot (no sidespin)
-        _, final_straight = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=3000.0,
-            sidespin_rpm=0.0,
-        )
+        _, final_straight = flights["mid"]
 
         # Slice shot (positive sidespin)
-        _, final_slice = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=3000.0,
-            sidespin_rpm=1500.0,  # Slice
-        )
+        _, final_slice = flights["mid_slice"]
 
         # Slice should curve right (positive Z)
         assert final_slice.pos.z > final_straight.pos.z
 
-    def test_spin_decay_over_time(self) -> None:
+    def test_spin_decay_over_time(self, flights: _FlightCache) -> None:
         """Test that spin decays during flight."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
-        initial_spin = 3000.0
-        _, final_state = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=initial_spin,
-            sidespin_rpm=0.0,
-        )
+        initial_spin = SHOT_CATALOG["mid"][1]["backspin_rpm"]
+        _, final_state = flights["mid"]
 
-        # Spin should decay: spin_new = spin * (1 - SPIN_DECAY_RATE)^time
-        # After ~5 seconds of flight, spin should be noticeably reduced
+        # Spin decays exponentially: spin_new = spin * exp(-SPIN_DECAY_RATE * time)
         assert final_state.spin_back < initial_spin
+        assert final_state.spin_back == pytest.approx(
+            initial_spin * math.exp(-SPIN_DECAY_RATE * final_state.t)
+        )
 
-    def test_trajectory_terminates_on_landing(self) -> None:
+    def test_trajectory_terminates_on_landing(self, flights: _FlightCache) -> None:
         """Test that trajectory terminates when ball lands (y <= 0)."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=100.0,
-            vla_deg=10.0,
-            hla_deg=0.0,
-            backspin_rpm=2500.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["low_punch"]
 
         # Final state should be at or below ground
         assert final_state.pos.y <= 0.01
@@ -342,20 +351,31 @@ class TestFlightSimulator:
         for point in trajectory[:-1]:
             assert point.y >= -0.01
 
-    def test_trajectory_output_format(self) -> None:
-        """Test that trajectory output is in correct units (yards, feet)."""
+    def test_landing_refined_within_coarse_step(self) -> None:
+        """Test that a coarse time step still finds touchdown accurately."""
         from gc2_connect.open_range.physics.trajectory import FlightSimulator
 
         conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
-        trajectory, _ = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=3000.0,
-            sidespin_rpm=0.0,
-        )
+        coarse = FlightSimulator(conditions=conditions, dt=0.02)
+        fine = FlightSimulator(conditions=conditions, dt=0.0025)
+
+        shot = {
+            "ball_speed_mph": 150.0,
+            "vla_deg": 12.0,
+            "hla_deg": 0.0,
+            "backspin_rpm": 3000.0,
+            "sidespin_rpm": 0.0,
+        }
+        _, final_coarse = coarse.simulate_flight(**shot)
+        _, final_fine = fine.simulate_flight(**shot)
+
+        assert final_coarse.pos.y == 0.0
+        assert final_coarse.t == pytest.approx(final_fine.t, abs=1e-3)
+        assert final_coarse.pos.x == pytest.approx(final_fine.pos.x, abs=0.05)
+
+    def test_trajectory_output_format(self, flights: _FlightCache) -> None:
+        """Test that trajectory output is in correct units (yards, feet)."""
+        trajectory, _ = flights["mid"]
 
         # All points should be TrajectoryPoint objects
         assert all(isinstance(p, TrajectoryPoint) for p in trajectory)
@@ -368,104 +388,39 @@ class TestFlightSimulator:
         assert times == sorted(times)
 
 
+@pytest.mark.flight
 class TestWindModel:
     """Tests for wind effect on trajectory."""
 
-    def test_headwind_decreases_carry(self) -> None:
-        """Test that headwind decreases carry distance."""
+    @pytest.mark.parametrize(
+        ("wind_dir", "wind_mph", "coord", "cmp"),
+        [
+            # 0 degrees = from north = headwind, shortens carry
+            (0.0, 15.0, "x", operator.lt),
+            # 180 degrees = from south = tailwind, extends carry
+            (180.0, 15.0, "x", operator.gt),
+            # 90 degrees = from east = left-to-right, pushes ball to +Z
+            (90.0, 15.0, "z", operator.gt),
+        ],
+        ids=["headwind", "tailwind", "crosswind"],
+    )
+    def test_wind_moves_landing(
+        self,
+        calm_7iron: SimulationState,
+        wind_dir: float,
+        wind_mph: float,
+        coord: str,
+        cmp: Callable[[float, float], bool],
+    ) -> None:
+        """Test that wind shifts the landing point relative to calm air."""
         from gc2_connect.open_range.physics.trajectory import FlightSimulator
 
-        # No wind
-        conditions_calm = Conditions(wind_speed_mph=0.0)
-        sim_calm = FlightSimulator(conditions=conditions_calm, dt=0.01)
+        conditions = Conditions(wind_speed_mph=wind_mph, wind_dir_deg=wind_dir)
+        sim_wind = FlightSimulator(conditions=conditions, dt=0.01)
 
-        # Headwind (0 degrees = from north = headwind)
-        conditions_headwind = Conditions(wind_speed_mph=15.0, wind_dir_deg=0.0)
-        sim_headwind = FlightSimulator(conditions=conditions_headwind, dt=0.01)
+        _, final_wind = sim_wind.simulate_flight(**SEVEN_IRON)
 
-        # 7-iron shot
-        _, final_calm = sim_calm.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        _, final_headwind = sim_headwind.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        # Headwind should reduce carry distance
-        assert final_headwind.pos.x < final_calm.pos.x
-
-    def test_tailwind_increases_carry(self) -> None:
-        """Test that tailwind increases carry distance."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        # No wind
-        conditions_calm = Conditions(wind_speed_mph=0.0)
-        sim_calm = FlightSimulator(conditions=conditions_calm, dt=0.01)
-
-        # Tailwind (180 degrees = from south = tailwind)
-        conditions_tailwind = Conditions(wind_speed_mph=15.0, wind_dir_deg=180.0)
-        sim_tailwind = FlightSimulator(conditions=conditions_tailwind, dt=0.01)
-
-        # 7-iron shot
-        _, final_calm = sim_calm.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        _, final_tailwind = sim_tailwind.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        # Tailwind should increase carry distance
-        assert final_tailwind.pos.x > final_calm.pos.x
-
-    def test_crosswind_creates_drift(self) -> None:
-        """Test that crosswind creates lateral drift."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        # No wind
-        conditions_calm = Conditions(wind_speed_mph=0.0)
-        sim_calm = FlightSimulator(conditions=conditions_calm, dt=0.01)
-
-        # Crosswind from left (90 degrees = from east = left-to-right)
-        conditions_cross = Conditions(wind_speed_mph=15.0, wind_dir_deg=90.0)
-        sim_cross = FlightSimulator(conditions=conditions_cross, dt=0.01)
-
-        # Straight shot
-        _, final_calm = sim_calm.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        _, final_cross = sim_cross.simulate_flight(
-            ball_speed_mph=120.0,
-            vla_deg=16.3,
-            hla_deg=0.0,
-            backspin_rpm=7097.0,
-            sidespin_rpm=0.0,
-        )
-
-        # Crosswind should push ball laterally (positive Z for left-to-right wind)
-        assert final_cross.pos.z > final_calm.pos.z
+        assert cmp(getattr(final_wind.pos, coord), getattr(calm_7iron.pos, coord))
 
     def test_wind_at_height(self) -> None:
         """Test logarithmic wind profile at different heights."""
@@ -507,6 +462,7 @@ class TestRK4Integration:
             spin_side=0.0,
             t=0.0,
             phase=Phase.FLIGHT,
+            apex_y=10.0,
         )
 
         new_state = simulator.rk4_step(state)
@@ -519,13 +475,12 @@ class TestRK4Integration:
         assert new_state.pos.x > state.pos.x
         assert new_state.pos.y < state.pos.y
 
-    def test_rk4_preserves_energy_approximately(self) -> None:
-        """Test that RK4 approximately preserves energy in gravity-only case."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator, SimulationState
+        # The apex so far is carried forward while the ball descends
+        assert new_state.apex_y == 10.0
 
-        # Near-vacuum for gravity-only
-        conditions = Conditions(elevation_ft=100000.0)
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
+    def test_rk4_preserves_energy_approximately(self, simulator_vacuum: FlightSimulator) -> None:
+        """Test that RK4 approximately preserves energy in gravity-only case."""
+        from gc2_connect.open_range.physics.trajectory import SimulationState
 
         state = SimulationState(
             pos=Vec3(x=0, y=10, z=0),
@@ -543,7 +498,7 @@ class TestRK4Integration:
 
         # Run 100 steps
         for _ in range(100):
-            state = simulator.rk4_step(state)
+            state = simulator_vacuum.rk4_step(state)
 
         # Calculate final energy
         final_ke = 0.5 * BALL_MASS_KG * state.vel.mag() ** 2
@@ -557,13 +512,8 @@ class TestRK4Integration:
 class TestForceCalculations:
     """Tests for force calculation components."""
 
-    def test_gravity_force(self) -> None:
+    def test_gravity_force(self, simulator: FlightSimulator) -> None:
         """Test gravity force calculation."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Gravity should be constant regardless of position/velocity
         gravity = simulator._gravity_force()
         expected_y = -BALL_MASS_KG * GRAVITY_MS2
@@ -572,13 +522,8 @@ class TestForceCalculations:
         assert gravity.y == pytest.approx(expected_y, rel=1e-6)
         assert gravity.z == 0.0
 
-    def test_drag_force_opposes_motion(self) -> None:
+    def test_drag_force_opposes_motion(self, simulator: FlightSimulator) -> None:
         """Test that drag force opposes motion direction."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Ball moving forward and up
         vel = Vec3(x=50, y=10, z=5)
         pos = Vec3(x=100, y=30, z=10)
@@ -590,13 +535,8 @@ class TestForceCalculations:
         assert drag.y < 0  # Opposing upward motion
         assert drag.z < 0  # Opposing rightward motion
 
-    def test_magnus_force_with_backspin(self) -> None:
+    def test_magnus_force_with_backspin(self, simulator: FlightSimulator) -> None:
         """Test Magnus force creates lift with backspin."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Ball moving forward with backspin
         vel = Vec3(x=50, y=0, z=0)
         pos = Vec3(x=100, y=30, z=0)
@@ -606,13 +546,8 @@ class TestForceCalculations:
         # Backspin + forward motion = upward Magnus force (lift)
         assert magnus.y > 0
 
-    def test_magnus_force_with_sidespin(self) -> None:
+    def test_magnus_force_with_sidespin(self, simulator: FlightSimulator) -> None:
         """Test Magnus force creates lateral curve with sidespin."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Ball moving forward with sidespin (slice)
         vel = Vec3(x=50, y=0, z=0)
         pos = Vec3(x=100, y=30, z=0)
@@ -623,103 +558,50 @@ class TestForceCalculations:
         assert magnus.z > 0
 
 
+@pytest.mark.flight
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_zero_ball_speed(self) -> None:
+    def test_zero_ball_speed(self, flights: _FlightCache) -> None:
         """Test handling of zero ball speed."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=0.0,
-            vla_deg=10.0,
-            hla_deg=0.0,
-            backspin_rpm=2500.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["zero_speed"]
 
         # Should return immediately with minimal trajectory
         assert len(trajectory) >= 1
         # Ball should be at origin
         assert final_state.pos.x == pytest.approx(0.0, abs=0.1)
 
-    def test_very_high_ball_speed(self) -> None:
+    def test_very_high_ball_speed(self, flights: _FlightCache) -> None:
         """Test with very high ball speed (beyond normal golf shots)."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # 200 mph - very fast but possible with testing equipment
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=200.0,
-            vla_deg=10.0,
-            hla_deg=0.0,
-            backspin_rpm=2000.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["very_fast"]
 
         # Should complete without error
         assert len(trajectory) > 0
         assert final_state.pos.y <= 0.01
 
-    def test_extreme_spin_rates(self) -> None:
+    def test_extreme_spin_rates(self, flights: _FlightCache) -> None:
         """Test with extreme spin rates."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Very high spin (15000 rpm - unusual but possible)
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=100.0,
-            vla_deg=45.0,
-            hla_deg=0.0,
-            backspin_rpm=15000.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["extreme_spin"]
 
         # Should complete without error
         assert len(trajectory) > 0
 
-    def test_max_simulation_time(self) -> None:
+    def test_max_simulation_time(self, flights: _FlightCache) -> None:
         """Test that simulation respects maximum time limit."""
         from gc2_connect.open_range.physics.constants import MAX_TIME
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
 
         # Very high launch angle to maximize flight time
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=200.0,
-            vla_deg=85.0,  # Nearly vertical
-            hla_deg=0.0,
-            backspin_rpm=1000.0,
-            sidespin_rpm=0.0,
-        )
+        trajectory, final_state = flights["near_vertical"]
 
         # Time should not exceed MAX_TIME
         assert final_state.t <= MAX_TIME
 
-    def test_negative_spin_values(self) -> None:
+    def test_negative_spin_values(self, flights: _FlightCache) -> None:
         """Test handling of negative spin values (hook vs slice)."""
-        from gc2_connect.open_range.physics.trajectory import FlightSimulator
-
-        conditions = Conditions()
-        simulator = FlightSimulator(conditions=conditions, dt=0.01)
-
         # Negative sidespin = hook (curves left)
-        trajectory, final_state = simulator.simulate_flight(
-            ball_speed_mph=150.0,
-            vla_deg=12.0,
-            hla_deg=0.0,
-            backspin_rpm=3000.0,
-            sidespin_rpm=-1500.0,  # Hook
-        )
+        trajectory, final_state = flights["mid_hook"]
 
         # Ball should curve left (negative Z)
         assert final_state.pos.z < 0
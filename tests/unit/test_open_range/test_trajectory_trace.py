@@ -4,11 +4,47 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+from typing import Any
+
 import pytest
 
 from gc2_connect.open_range.models import Phase, TrajectoryPoint, Vec3
 
 
+class FakeSphere:
+    """Stand-in for a NiceGUI scene sphere that records its position and deletion."""
+
+    def __init__(self) -> None:
+        self.position: tuple[float, float, float] | None = None
+        self.deleted = False
+
+    def material(self, color: str) -> FakeSphere:
+        return self
+
+    def move(self, x: float, y: float, z: float) -> FakeSphere:
+        self.position = (x, y, z)
+        return self
+
+    def delete(self) -> None:
+        self.deleted = True
+
+
+@pytest.fixture
+def spheres(monkeypatch: pytest.MonkeyPatch) -> list[FakeSphere]:
+    """Make trace drawing create FakeSpheres; returns them in creation order."""
+    from nicegui import ui
+
+    created: list[FakeSphere] = []
+
+    def sphere(**_kwargs: Any) -> FakeSphere:
+        created.append(FakeSphere())
+        return created[-1]
+
+    monkeypatch.setattr(ui.scene, "sphere", sphere)
+    return created
+
+
 # Test trajectory data for trace tests
 @pytest.fixture
 def sample_trajectory() -> list[TrajectoryPoint]:
@@ -70,6 +106,25 @@ class TestTrajectoryTraceCreation:
         trace = TrajectoryTrace(max_segments=100)
         assert trace.max_segments == 100
 
+    def test_trajectory_trace_with_initial_segments(self) -> None:
+        """Test that TrajectoryTrace can be preloaded with segments."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TraceSegment,
+            TrajectoryTrace,
+        )
+
+        drawn = object()
+        segments = [
+            TraceSegment(Vec3(x=0, y=0, z=float(i)), Vec3(x=0, y=0, z=float(i + 1)), Phase.FLIGHT)
+            for i in range(4)
+        ]
+        segments[-1].scene_object = drawn
+
+        trace = TrajectoryTrace(max_segments=3, segments=segments)
+
+        assert list(trace.segments) == segments[1:]
+        assert trace.segments[-1].scene_object is drawn
+
 
 class TestTrajectorySegments:
     """Tests for trajectory segment management."""
@@ -126,6 +181,70 @@ class TestTrajectorySegments:
         # Should be limited to max_segments
         assert len(trace.segments) == 5
 
+    def test_max_segments_keeps_most_recent(self) -> None:
+        """Test that once full, new segments replace the oldest ones."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace(max_segments=5)
+
+        for i in range(12):
+            trace.add_segment(
+                Vec3(x=0, y=0, z=float(i)),
+                Vec3(x=0, y=0, z=float(i + 1)),
+                Phase.FLIGHT,
+            )
+
+        # Oldest first: segments 7..11 survive
+        assert [s.start.z for s in trace.segments] == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert trace.segments[-1].end == Vec3(x=0, y=0, z=12.0)
+
+    def test_reassigning_max_segments_resizes(self, spheres: list[FakeSphere]) -> None:
+        """Test that changing max_segments keeps the newest segments that fit."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace(max_segments=3)
+        for i in range(5):
+            trace.add_point(Vec3(x=0, y=0, z=float(i)), Phase.FLIGHT)
+        trace.draw_in_scene(nullcontext())
+
+        trace.max_segments = 10
+        trace.add_point(Vec3(x=0, y=0, z=5.0), Phase.FLIGHT)
+        assert trace.max_segments == 10
+        assert [s.start.z for s in trace.segments] == [1.0, 2.0, 3.0, 4.0]
+
+        trace.max_segments = 2
+        assert [s.start.z for s in trace.segments] == [3.0, 4.0]
+
+        # Dropped segments lose their breadcrumbs; the kept one isn't redrawn
+        trace.draw_in_scene(nullcontext())
+        assert [sphere.deleted for sphere in spheres] == [True, True, False, False]
+        assert [s.scene_object for s in trace.segments] == spheres[2:]
+
+    def test_build_over_capacity_matches_progressive(
+        self, sample_trajectory: list[TrajectoryPoint]
+    ) -> None:
+        """Test that batch building keeps the same segments as adding points."""
+        from gc2_connect.open_range.visualization.range_scene import (
+            trajectory_to_scene_coords,
+        )
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        built = TrajectoryTrace(max_segments=4)
+        built.build_from_trajectory(sample_trajectory)
+
+        progressive = TrajectoryTrace(max_segments=4)
+        scene_points = trajectory_to_scene_coords(sample_trajectory)
+        for point, position in zip(sample_trajectory, scene_points, strict=True):
+            progressive.add_point(position, point.phase)
+
+        assert list(built.segments) == list(progressive.segments)
+
     def test_clear_removes_all_segments(self) -> None:
         """Test that clear removes all segments."""
         from gc2_connect.open_range.visualization.trajectory_trace import (
@@ -140,6 +259,24 @@ class TestTrajectorySegments:
 
         assert len(trace.segments) == 0
 
+    def test_segments_view_indexing(self) -> None:
+        """Test that the segments view supports negative indices and slices."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace()
+        segments = trace.segments
+        trace.add_segment(Vec3(x=0, y=0, z=0), Vec3(x=1, y=1, z=10), Phase.FLIGHT)
+        trace.add_segment(Vec3(x=1, y=1, z=10), Vec3(x=2, y=0, z=20), Phase.BOUNCE)
+
+        # View is live and reflects segments added after it was taken
+        assert len(segments) == 2
+        assert segments[-1].end == Vec3(x=2, y=0, z=20)
+        assert [s.phase for s in segments[:1]] == [Phase.FLIGHT]
+        with pytest.raises(IndexError):
+            segments[2]
+
 
 class TestPhaseColors:
     """Tests for phase-specific colors in trajectory trace."""
@@ -304,6 +441,67 @@ class TestProgressiveTrace:
         assert trace.segments[1].phase == Phase.BOUNCE
 
 
+class TestTraceDrawing:
+    """Tests for drawing trace breadcrumbs in a scene."""
+
+    def test_draw_segment_records_sphere_on_trace(self, spheres: list[FakeSphere]) -> None:
+        """Test that drawing a segment from the view is remembered by the trace."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace()
+        scene = nullcontext()
+        trace.add_point(Vec3(x=0, y=0, z=0), Phase.FLIGHT)
+        for i in range(1, 3):
+            trace.add_point(Vec3(x=0, y=0, z=float(i)), Phase.FLIGHT)
+            trace.draw_segment_in_scene(scene, trace.segments[-1])
+            trace.draw_segment_in_scene(scene, trace.segments[-1])
+
+        trace.draw_in_scene(scene)
+
+        assert len(spheres) == 2
+        assert [s.scene_object for s in trace.segments] == spheres
+
+    def test_draw_foreign_segment_is_cleared_with_trace(self, spheres: list[FakeSphere]) -> None:
+        """Test that segments not held by the trace are drawn and cleaned up."""
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TraceSegment,
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace()
+        segment = TraceSegment(Vec3(x=0, y=0, z=0), Vec3(x=0, y=0, z=1), Phase.BOUNCE)
+
+        trace.draw_segment_in_scene(nullcontext(), segment)
+        trace.clear()
+
+        assert segment.scene_object is spheres[0]
+        assert spheres[0].deleted
+
+    def test_draw_equal_copy_is_not_matched_to_trace(self, spheres: list[FakeSphere]) -> None:
+        """Test that only the stored segment object, not an equal copy, is tracked."""
+        from dataclasses import replace
+
+        from gc2_connect.open_range.visualization.trajectory_trace import (
+            TrajectoryTrace,
+        )
+
+        trace = TrajectoryTrace()
+        trace.add_segment(Vec3(x=0, y=0, z=0), Vec3(x=0, y=0, z=1), Phase.FLIGHT)
+        stored = trace.segments[0]
+        copy = replace(stored)
+
+        trace.draw_segment_in_scene(nullcontext(), copy)
+        trace.draw_in_scene(nullcontext())
+
+        assert trace.segments[0] is stored
+        assert copy.scene_object is spheres[0]
+        assert stored.scene_object is spheres[1]
+        trace.clear()
+        assert all(sphere.deleted for sphere in spheres)
+
+
 class TestTraceVisibility:
     """Tests for trace visibility management."""
 
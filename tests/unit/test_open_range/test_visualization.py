@@ -102,7 +102,7 @@ class TestRangeScene:
         assert 100 in DISTANCE_MARKERS
         assert 200 in DISTANCE_MARKERS
         # Markers should be in ascending order
-        assert sorted(DISTANCE_MARKERS) == DISTANCE_MARKERS
+        assert tuple(sorted(DISTANCE_MARKERS)) == DISTANCE_MARKERS
 
     def test_target_greens_configuration(self) -> None:
         """Test target green positions are correctly configured."""
@@ -121,6 +121,21 @@ class TestRangeScene:
             assert green["distance"] > 0
             assert green["radius"] > 0
 
+    def test_scene_constants_are_read_only(self) -> None:
+        """Test module-level scene constants cannot be mutated at runtime."""
+        from gc2_connect.open_range.visualization.ball_animation import PHASE_COLORS
+        from gc2_connect.open_range.visualization.range_scene import (
+            DISTANCE_MARKERS,
+            TARGET_GREENS,
+        )
+
+        assert isinstance(DISTANCE_MARKERS, tuple)
+        assert isinstance(TARGET_GREENS, tuple)
+        with pytest.raises(TypeError):
+            TARGET_GREENS[0]["radius"] = 1.0  # type: ignore[index]
+        with pytest.raises(TypeError):
+            PHASE_COLORS[Phase.FLIGHT] = "#000000"  # type: ignore[index]
+
     def test_range_dimensions(self) -> None:
         """Test that range dimensions are appropriate."""
         from gc2_connect.open_range.visualization.range_scene import (
@@ -210,6 +225,22 @@ class TestBallAnimator:
         # At t=4.5, should be STOPPED
         assert animator.get_phase_at_time(4.5) == Phase.STOPPED
 
+    def test_get_phase_at_time_follows_reassigned_trajectory(
+        self, sample_trajectory: list[TrajectoryPoint]
+    ) -> None:
+        """Test phase lookup outside the trajectory and after reassignment."""
+        from gc2_connect.open_range.visualization.ball_animation import BallAnimator
+
+        animator = BallAnimator()
+        animator.trajectory = sample_trajectory
+
+        # Before launch clamps to the first point, after the end to the last
+        assert animator.get_phase_at_time(-1.0) == Phase.FLIGHT
+        assert animator.get_phase_at_time(99.0) == Phase.STOPPED
+
+        animator.trajectory = sample_trajectory[:3]
+        assert animator.get_phase_at_time(99.0) == sample_trajectory[2].phase
+
     def test_get_position_at_time(self, sample_trajectory: list[TrajectoryPoint]) -> None:
         """Test position interpolation at specific times."""
         from gc2_connect.open_range.visualization.ball_animation import BallAnimator
@@ -233,6 +264,23 @@ class TestBallAnimator:
         assert 0.0 < pos.x < 50.0
         assert 0.0 < pos.y < 30.0
 
+    def test_get_position_at_time_late_segment(
+        self, sample_trajectory: list[TrajectoryPoint]
+    ) -> None:
+        """Test interpolation picks the right bracket deep into the trajectory."""
+        from gc2_connect.open_range.visualization.ball_animation import BallAnimator
+
+        animator = BallAnimator()
+        animator.trajectory = sample_trajectory
+
+        # Halfway between t=3.6 (x=282) and t=4.0 (x=290)
+        pos = animator.get_position_at_time(3.8)
+        assert pos.x == pytest.approx(286.0)
+        assert pos.z == pytest.approx(4.15)
+
+        # Past the end clamps to the final point
+        assert animator.get_position_at_time(10.0).x == sample_trajectory[-1].x
+
     def test_stop_animation(self) -> None:
         """Test that animation can be stopped."""
         from gc2_connect.open_range.visualization.ball_animation import BallAnimator
@@ -260,6 +308,27 @@ class TestBallAnimator:
         # Trajectory should be preserved after reset
         assert len(animator.trajectory) > 0
 
+    async def test_animate_shot_drives_scene(self, sample_shot_result: ShotResult) -> None:
+        """Test that animating a shot moves the ball and reports each phase once."""
+        from unittest.mock import MagicMock
+
+        from gc2_connect.open_range.visualization.ball_animation import BallAnimator
+
+        animator = BallAnimator()
+        scene = MagicMock()
+        phases: list[Phase] = []
+
+        await animator.animate_shot(
+            sample_shot_result, scene=scene, speed=50.0, on_phase_change=phases.append
+        )
+
+        assert phases == [Phase.BOUNCE, Phase.ROLLING]
+        assert scene.update_ball_position.call_count == animator.current_frame + 1
+        # Final ball position is the end of the trajectory in scene coordinates
+        final_pos = scene.update_ball_position.call_args.args[0]
+        assert final_pos.z == pytest.approx(sample_shot_result.trajectory[-1].x)
+        assert animator.is_animating is False
+
 
 class TestCameraPosition:
     """Tests for camera positioning utilities."""
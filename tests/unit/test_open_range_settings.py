@@ -5,8 +5,59 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
+
+import pytest
+
+from gc2_connect.config.settings import ConditionsSettings, OpenRangeSettings, Settings
+
+SettingsAt = Callable[..., Path]
+WriteV1 = Callable[..., Path]
+
+# Canonical v1 settings file: no mode or open_range sections
+V1_SETTINGS: dict[str, Any] = {
+    "version": 1,
+    "gspro": {"host": "192.168.1.1", "port": 921, "auto_connect": True},
+    "gc2": {"auto_connect": True, "reject_zero_spin": True, "use_mock": False},
+    "ui": {"theme": "dark", "show_history": True, "history_limit": 50},
+}
+
+
+@pytest.fixture
+def settings_at(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SettingsAt:
+    """Fixture pointing the default settings path at a file under tmp_path.
+
+    Returns a callable taking an optional file name and returning the path
+    that Settings.load()/save() will use until the test finishes.
+    """
+
+    def _point_at(name: str = "settings.json") -> Path:
+        path = tmp_path / name
+        monkeypatch.setattr("gc2_connect.config.settings.get_settings_path", lambda: path)
+        return path
+
+    return _point_at
+
+
+@pytest.fixture
+def write_v1(settings_at: SettingsAt) -> WriteV1:
+    """Fixture writing a v1 settings file at the default settings path.
+
+    Returns a callable taking top-level section overrides; a section passed
+    as None is left out of the file. Returns the written path.
+    """
+
+    def _write(**sections: Any) -> Path:
+        data = {
+            key: value for key, value in {**V1_SETTINGS, **sections}.items() if value is not None
+        }
+        path = settings_at()
+        path.write_text(json.dumps(data))
+        return path
+
+    return _write
 
 
 class TestConditionsSettings:
@@ -14,8 +65,6 @@ class TestConditionsSettings:
 
     def test_default_values(self) -> None:
         """Test ConditionsSettings has correct defaults."""
-        from gc2_connect.config.settings import ConditionsSettings
-
         conditions = ConditionsSettings()
         assert conditions.temp_f == 70.0
         assert conditions.elevation_ft == 0.0
@@ -25,8 +74,6 @@ class TestConditionsSettings:
 
     def test_custom_values(self) -> None:
         """Test creating ConditionsSettings with custom values."""
-        from gc2_connect.config.settings import ConditionsSettings
-
         conditions = ConditionsSettings(
             temp_f=85.0,
             elevation_ft=5280.0,
@@ -42,8 +89,6 @@ class TestConditionsSettings:
 
     def test_to_dict(self) -> None:
         """Test converting to dictionary."""
-        from gc2_connect.config.settings import ConditionsSettings
-
         conditions = ConditionsSettings(temp_f=75.0, wind_speed_mph=5.0)
         result = conditions.model_dump()
         assert result == {
@@ -60,8 +105,6 @@ class TestOpenRangeSettings:
 
     def test_default_values(self) -> None:
         """Test OpenRangeSettings has correct defaults."""
-        from gc2_connect.config.settings import OpenRangeSettings
-
         or_settings = OpenRangeSettings()
         assert or_settings.surface == "Fairway"
         assert or_settings.show_trajectory is True
@@ -72,8 +115,6 @@ class TestOpenRangeSettings:
 
     def test_custom_values(self) -> None:
         """Test creating OpenRangeSettings with custom values."""
-        from gc2_connect.config.settings import ConditionsSettings, OpenRangeSettings
-
         conditions = ConditionsSettings(temp_f=80.0, elevation_ft=1000.0)
         or_settings = OpenRangeSettings(
             conditions=conditions,
@@ -88,8 +129,6 @@ class TestOpenRangeSettings:
 
     def test_to_dict(self) -> None:
         """Test converting to dictionary."""
-        from gc2_connect.config.settings import OpenRangeSettings
-
         or_settings = OpenRangeSettings(surface="Green")
         result = or_settings.model_dump()
         assert result["surface"] == "Green"
@@ -103,39 +142,29 @@ class TestSettingsWithOpenRange:
 
     def test_settings_has_open_range(self) -> None:
         """Test that Settings includes open_range field."""
-        from gc2_connect.config.settings import Settings
-
         settings = Settings()
         assert hasattr(settings, "open_range")
         assert settings.open_range is not None
 
     def test_settings_has_mode(self) -> None:
         """Test that Settings includes mode field."""
-        from gc2_connect.config.settings import Settings
-
         settings = Settings()
         assert hasattr(settings, "mode")
         assert settings.mode == "gspro"  # Default mode
 
     def test_settings_version_is_2(self) -> None:
         """Test that Settings version is now 2."""
-        from gc2_connect.config.settings import Settings
-
         settings = Settings()
         assert settings.version == 2
 
     def test_settings_open_range_defaults(self) -> None:
         """Test that Settings.open_range has correct defaults."""
-        from gc2_connect.config.settings import Settings
-
         settings = Settings()
         assert settings.open_range.surface == "Fairway"
         assert settings.open_range.conditions.temp_f == 70.0
 
     def test_settings_to_dict_includes_open_range(self) -> None:
         """Test that to_dict includes open_range and mode."""
-        from gc2_connect.config.settings import Settings
-
         settings = Settings()
         result = settings.to_dict()
         assert "open_range" in result
@@ -143,15 +172,17 @@ class TestSettingsWithOpenRange:
         assert result["mode"] == "gspro"
         assert result["open_range"]["surface"] == "Fairway"
 
-    def test_settings_save_load_roundtrip_with_open_range(self, tmp_path: Path) -> None:
-        """Test save then load preserves open_range settings."""
-        from gc2_connect.config.settings import (
-            ConditionsSettings,
-            OpenRangeSettings,
-            Settings,
-        )
+    def test_nested_defaults_are_independent(self) -> None:
+        """Test that each Settings gets its own nested default models."""
+        first = Settings()
+        second = Settings()
+        first.open_range.conditions.temp_f = 95.0
+        assert second.open_range.conditions.temp_f == 70.0
+        assert first.gspro is not second.gspro
 
-        settings_path = tmp_path / "settings.json"
+    def test_settings_save_load_roundtrip_with_open_range(self, settings_at: SettingsAt) -> None:
+        """Test save then load preserves open_range settings."""
+        settings_at()
 
         original = Settings(
             mode="open_range",
@@ -166,9 +197,8 @@ class TestSettingsWithOpenRange:
             ),
         )
 
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            original.save()
-            loaded = Settings.load()
+        original.save()
+        loaded = Settings.load()
 
         assert loaded.mode == "open_range"
         assert loaded.open_range.conditions.temp_f == 85.0
@@ -181,22 +211,11 @@ class TestSettingsWithOpenRange:
 class TestSettingsMigration:
     """Tests for settings migration from v1 to v2."""
 
-    def test_migrate_v1_to_v2_adds_open_range(self, tmp_path: Path) -> None:
+    def test_migrate_v1_to_v2_adds_open_range(self, write_v1: WriteV1) -> None:
         """Test that loading v1 settings adds open_range with defaults."""
-        from gc2_connect.config.settings import Settings
+        write_v1(gspro={"host": "192.168.1.50", "port": 921, "auto_connect": True})
 
-        settings_path = tmp_path / "settings.json"
-        # v1 settings without open_range or mode
-        v1_data = {
-            "version": 1,
-            "gspro": {"host": "192.168.1.50", "port": 921, "auto_connect": True},
-            "gc2": {"auto_connect": True, "reject_zero_spin": True, "use_mock": False},
-            "ui": {"theme": "dark", "show_history": True, "history_limit": 50},
-        }
-        settings_path.write_text(json.dumps(v1_data))
-
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            settings = Settings.load()
+        settings = Settings.load()
 
         # Should have open_range with defaults
         assert settings.open_range is not None
@@ -209,21 +228,15 @@ class TestSettingsMigration:
         assert settings.gspro.auto_connect is True
         assert settings.gc2.auto_connect is True
 
-    def test_migrate_v1_preserves_gspro_settings(self, tmp_path: Path) -> None:
+    def test_migrate_v1_preserves_gspro_settings(self, write_v1: WriteV1) -> None:
         """Test that migrating from v1 preserves GSPro settings."""
-        from gc2_connect.config.settings import Settings
-
-        settings_path = tmp_path / "settings.json"
-        v1_data = {
-            "version": 1,
-            "gspro": {"host": "10.0.0.5", "port": 9000, "auto_connect": False},
-            "gc2": {"auto_connect": False, "reject_zero_spin": False, "use_mock": True},
-            "ui": {"theme": "light", "show_history": False, "history_limit": 100},
-        }
-        settings_path.write_text(json.dumps(v1_data))
+        write_v1(
+            gspro={"host": "10.0.0.5", "port": 9000, "auto_connect": False},
+            gc2={"auto_connect": False, "reject_zero_spin": False, "use_mock": True},
+            ui={"theme": "light", "show_history": False, "history_limit": 100},
+        )
 
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            settings = Settings.load()
+        settings = Settings.load()
 
         assert settings.gspro.host == "10.0.0.5"
         assert settings.gspro.port == 9000
@@ -235,11 +248,9 @@ class TestSettingsMigration:
         assert settings.ui.show_history is False
         assert settings.ui.history_limit == 100
 
-    def test_load_v2_settings_directly(self, tmp_path: Path) -> None:
+    def test_load_v2_settings_directly(self, settings_at: SettingsAt) -> None:
         """Test that v2 settings load correctly without migration."""
-        from gc2_connect.config.settings import Settings
-
-        settings_path = tmp_path / "settings.json"
+        settings_path = settings_at()
         v2_data = {
             "version": 2,
             "mode": "open_range",
@@ -261,8 +272,7 @@ class TestSettingsMigration:
         }
         settings_path.write_text(json.dumps(v2_data))
 
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            settings = Settings.load()
+        settings = Settings.load()
 
         assert settings.version == 2
         assert settings.mode == "open_range"
@@ -271,22 +281,12 @@ class TestSettingsMigration:
         assert settings.open_range.surface == "Green"
         assert settings.open_range.camera_follow is False
 
-    def test_migration_saves_as_v2(self, tmp_path: Path) -> None:
+    def test_migration_saves_as_v2(self, write_v1: WriteV1) -> None:
         """Test that after migrating v1, saving creates v2 format."""
-        from gc2_connect.config.settings import Settings
-
-        settings_path = tmp_path / "settings.json"
-        v1_data = {
-            "version": 1,
-            "gspro": {"host": "192.168.1.1", "port": 921, "auto_connect": True},
-            "gc2": {"auto_connect": True, "reject_zero_spin": True, "use_mock": False},
-            "ui": {"theme": "dark", "show_history": True, "history_limit": 50},
-        }
-        settings_path.write_text(json.dumps(v1_data))
+        settings_path = write_v1()
 
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            settings = Settings.load()
-            settings.save()
+        settings = Settings.load()
+        settings.save()
 
         # Re-read the file
         saved_data = json.loads(settings_path.read_text())
@@ -295,20 +295,12 @@ class TestSettingsMigration:
         assert "open_range" in saved_data
         assert saved_data["open_range"]["surface"] == "Fairway"
 
-    def test_partial_v1_settings_get_defaults(self, tmp_path: Path) -> None:
+    def test_partial_v1_settings_get_defaults(self, write_v1: WriteV1) -> None:
         """Test that partial v1 settings still work with defaults filled in."""
-        from gc2_connect.config.settings import Settings
-
-        settings_path = tmp_path / "settings.json"
         # Minimal v1 settings
-        v1_data = {
-            "version": 1,
-            "gspro": {"host": "10.0.0.10", "port": 921, "auto_connect": False},
-        }
-        settings_path.write_text(json.dumps(v1_data))
+        write_v1(gspro={"host": "10.0.0.10", "port": 921, "auto_connect": False}, gc2=None, ui=None)
 
-        with patch("gc2_connect.config.settings.get_settings_path", return_value=settings_path):
-            settings = Settings.load()
+        settings = Settings.load()
 
         # Custom gspro setting preserved
         assert settings.gspro.host == "10.0.0.10"
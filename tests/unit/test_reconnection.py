@@ -4,13 +4,47 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock
+from collections.abc import Iterable
+from itertools import repeat
 
 import pytest
 
 from gc2_connect.utils.reconnect import ReconnectionManager, ReconnectionState
 
 
+class ScriptedConnect:
+    """Async connect function that replays scripted results and counts calls.
+
+    Exceptions in the script are raised instead of returned.
+    """
+
+    def __init__(self, results: Iterable[bool | Exception]) -> None:
+        self._results = iter(results)
+        self.call_count = 0
+
+    async def __call__(self) -> bool:
+        self.call_count += 1
+        result = next(self._results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Fixture making reconnect backoff waits return immediately.
+
+    Returns the list of delays the manager asked to wait, in order.
+    """
+    waits: list[float] = []
+
+    async def _no_wait(_self: ReconnectionManager, delay: float) -> None:
+        waits.append(delay)
+
+    monkeypatch.setattr(ReconnectionManager, "_wait_backoff", _no_wait)
+    return waits
+
+
 class TestReconnectionState:
     """Tests for ReconnectionState enum."""
 
@@ -48,6 +82,14 @@ class TestReconnectionManagerInit:
         assert manager.base_delay == 2.0
         assert manager.max_delay == 60.0
 
+    def test_manager_is_slotted(self) -> None:
+        """Test that managers carry no per-instance __dict__."""
+        manager = ReconnectionManager()
+
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.unknown_attribute = 1  # type: ignore[attr-defined]
+
 
 class TestExponentialBackoff:
     """Tests for exponential backoff timing."""
@@ -79,6 +121,14 @@ class TestExponentialBackoff:
             delay = manager.get_delay_for_attempt(attempt)
             assert delay == expected, f"Attempt {attempt}: expected {expected}, got {delay}"
 
+    def test_delay_follows_reassigned_limits(self) -> None:
+        """Test that changing base/max delay after init updates the sequence."""
+        manager = ReconnectionManager(base_delay=1.0, max_delay=16.0)
+        manager.base_delay = 0.5
+        manager.max_delay = 3.0
+
+        assert [manager.get_delay_for_attempt(a) for a in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
 
 class TestReconnectionCallbacks:
     """Tests for reconnection status callbacks."""
@@ -128,6 +178,26 @@ class TestReconnectionCallbacks:
 
         assert results == ["cb1:connected", "cb2:connected"]
 
+    def test_failing_callback_does_not_block_others(self) -> None:
+        """Test that an exception in one callback still lets the rest run."""
+        manager = ReconnectionManager()
+        states: list[ReconnectionState] = []
+        attempts: list[int] = []
+
+        def broken(*_args: object) -> None:
+            raise RuntimeError("callback failed")
+
+        manager.on_state_change(broken)
+        manager.on_state_change(states.append)
+        manager.on_attempt(broken)
+        manager.on_attempt(lambda attempt, _delay: attempts.append(attempt))
+
+        manager._set_state(ReconnectionState.RECONNECTING)
+        manager._notify_attempt(1, 1.0)
+
+        assert states == [ReconnectionState.RECONNECTING]
+        assert attempts == [1]
+
 
 class TestReconnectionAttempt:
     """Tests for reconnection attempt logic."""
@@ -136,22 +206,22 @@ class TestReconnectionAttempt:
     async def test_successful_reconnect_first_attempt(self) -> None:
         """Test successful reconnection on first attempt."""
         manager = ReconnectionManager()
-        connect_fn = AsyncMock(return_value=True)
+        connect_fn = ScriptedConnect(repeat(True))
 
         result = await manager.attempt_reconnect(connect_fn)
 
         assert result is True
         assert manager.state == ReconnectionState.CONNECTED
         assert manager.retry_count == 0
-        connect_fn.assert_called_once()
+        assert connect_fn.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_successful_reconnect_after_failures(self) -> None:
+    async def test_successful_reconnect_after_failures(self, fast_backoff: list[float]) -> None:
         """Test successful reconnection after some failures."""
-        manager = ReconnectionManager(base_delay=0.01)  # Fast delays for testing
+        manager = ReconnectionManager(base_delay=0.01)
 
         # Fail twice, then succeed
-        connect_fn = AsyncMock(side_effect=[False, False, True])
+        connect_fn = ScriptedConnect([False, False, True])
 
         result = await manager.attempt_reconnect(connect_fn)
 
@@ -160,10 +230,10 @@ class TestReconnectionAttempt:
         assert connect_fn.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_max_retries_exceeded(self) -> None:
+    async def test_max_retries_exceeded(self, fast_backoff: list[float]) -> None:
         """Test that reconnection stops after max retries."""
         manager = ReconnectionManager(max_retries=3, base_delay=0.01)
-        connect_fn = AsyncMock(return_value=False)
+        connect_fn = ScriptedConnect(repeat(False))
 
         result = await manager.attempt_reconnect(connect_fn)
 
@@ -172,7 +242,7 @@ class TestReconnectionAttempt:
         assert connect_fn.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_state_transitions_during_reconnect(self) -> None:
+    async def test_state_transitions_during_reconnect(self, fast_backoff: list[float]) -> None:
         """Test correct state transitions during reconnection."""
         manager = ReconnectionManager(base_delay=0.01)
         states: list[ReconnectionState] = []
@@ -180,7 +250,7 @@ class TestReconnectionAttempt:
         manager.on_state_change(lambda s: states.append(s))
 
         # Fail once, then succeed
-        connect_fn = AsyncMock(side_effect=[False, True])
+        connect_fn = ScriptedConnect([False, True])
         await manager.attempt_reconnect(connect_fn)
 
         assert ReconnectionState.RECONNECTING in states
@@ -188,7 +258,7 @@ class TestReconnectionAttempt:
         assert states[-1] == ReconnectionState.CONNECTED
 
     @pytest.mark.asyncio
-    async def test_attempt_callback_invoked(self) -> None:
+    async def test_attempt_callback_invoked(self, fast_backoff: list[float]) -> None:
         """Test that attempt callbacks are invoked for each retry."""
         manager = ReconnectionManager(base_delay=0.01, max_delay=0.04)
         attempts: list[tuple[int, float]] = []
@@ -196,7 +266,7 @@ class TestReconnectionAttempt:
         manager.on_attempt(lambda a, d: attempts.append((a, d)))
 
         # Fail 3 times, then succeed
-        connect_fn = AsyncMock(side_effect=[False, False, False, True])
+        connect_fn = ScriptedConnect([False, False, False, True])
         await manager.attempt_reconnect(connect_fn)
 
         # Should have 3 retry attempts (first connection doesn't count as retry)
@@ -204,6 +274,8 @@ class TestReconnectionAttempt:
         assert attempts[0][0] == 1  # First retry is attempt #1
         assert attempts[1][0] == 2
         assert attempts[2][0] == 3
+        # Each retry waited its capped backoff delay
+        assert fast_backoff == [0.01, 0.02, 0.04]
 
 
 class TestReconnectionCancel:
@@ -212,22 +284,26 @@ class TestReconnectionCancel:
     @pytest.mark.asyncio
     async def test_cancel_stops_reconnection(self) -> None:
         """Test that cancel() stops ongoing reconnection."""
-        manager = ReconnectionManager(base_delay=1.0)  # Longer delay to allow cancellation
-        connect_fn = AsyncMock(return_value=False)
+        manager = ReconnectionManager(base_delay=30.0)  # Only cancel() can end the wait
+        started = asyncio.Event()
         states: list[ReconnectionState] = []
         manager.on_state_change(lambda s: states.append(s))
 
+        async def connect_fn() -> bool:
+            started.set()
+            return False
+
         # Start reconnection in background
         task = asyncio.create_task(manager.attempt_reconnect(connect_fn))
 
-        # Allow first attempt to fail
-        await asyncio.sleep(0.05)
+        # Wait for the first attempt to fail; the task is then in its backoff
+        await started.wait()
 
         # Cancel while waiting for retry
         manager.cancel()
 
-        # Wait for task to complete
-        result = await task
+        # Wait for task to complete; cancel() wakes the backoff immediately
+        result = await asyncio.wait_for(task, timeout=1.0)
 
         assert result is False
         assert manager.state == ReconnectionState.DISCONNECTED
@@ -5,10 +5,16 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from gc2_connect.config import settings as settings_module
 from gc2_connect.config.settings import (
     GC2Settings,
     GSProSettings,
@@ -140,6 +146,13 @@ class TestUISettings:
 class TestGetSettingsPath:
     """Tests for get_settings_path function."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_path_cache(self) -> Iterator[None]:
+        """Recompute the cached path under each test's patches, then forget it."""
+        get_settings_path.cache_clear()
+        yield
+        get_settings_path.cache_clear()
+
     def test_macos_path(self) -> None:
         """Test settings path on macOS."""
         with (
@@ -169,6 +182,15 @@ class TestGetSettingsPath:
             path = get_settings_path()
             assert path == Path("/home/testuser/.config/gc2-connect/settings.json")
 
+    def test_path_is_computed_once(self) -> None:
+        """Test that repeated calls reuse the first result."""
+        with patch("pathlib.Path.home", return_value=Path("/home/testuser")) as home:
+            first = get_settings_path()
+            second = get_settings_path()
+
+        assert first is second
+        assert home.call_count == 1
+
 
 class TestSettingsLoad:
     """Tests for Settings.load() method."""
@@ -249,6 +271,60 @@ class TestSettingsLoad:
         assert settings.gspro.host == "custom.host"
         assert settings.gspro.port == 1234
 
+    def test_repeated_loads_parse_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unchanged file is parsed once across many loads."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"version": 2, "gspro": {"host": "cached.host"}}))
+        parses: list[bytes] = []
+        real_from_json = settings_module.from_json
+
+        def counting_from_json(data: bytes) -> object:
+            parses.append(data)
+            return real_from_json(data)
+
+        monkeypatch.setattr(settings_module, "from_json", counting_from_json)
+
+        loaded = [Settings.load(settings_path) for _ in range(10)]
+
+        assert len(parses) == 1
+        assert all(s.gspro.host == "cached.host" for s in loaded)
+
+        # Rewriting the file is picked up on the next load
+        settings_path.write_text(json.dumps({"version": 2, "gspro": {"host": "changed.host"}}))
+        assert Settings.load(settings_path).gspro.host == "changed.host"
+        assert len(parses) == 2
+
+    def test_failed_read_is_not_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a transient read error does not stick for the unchanged file."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"version": 2, "gspro": {"host": "saved.host"}}))
+        real_read_bytes = Path.read_bytes
+        failures = [PermissionError("busy")]
+
+        def flaky_read_bytes(self: Path) -> bytes:
+            if failures:
+                raise failures.pop()
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", flaky_read_bytes)
+
+        assert Settings.load(settings_path).gspro.host == "127.0.0.1"
+        assert Settings.load(settings_path).gspro.host == "saved.host"
+
+    def test_loaded_settings_are_independent_copies(self, tmp_path: Path) -> None:
+        """Test that mutating loaded settings does not leak into later loads."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"version": 2, "gspro": {"host": "original"}}))
+
+        first = Settings.load(settings_path)
+        first.gspro.host = "mutated"
+
+        assert Settings.load(settings_path).gspro.host == "original"
+
 
 class TestSettingsSave:
     """Tests for Settings.save() method."""
@@ -296,6 +372,15 @@ class TestSettingsSave:
         assert data["ui"]["theme"] == "light"
         assert data["ui"]["history_limit"] == 100
 
+    def test_saved_file_matches_to_dict(self, tmp_path: Path) -> None:
+        """Test that the saved JSON holds exactly what to_dict returns."""
+        settings_path = tmp_path / "settings.json"
+        settings = Settings(gspro=GSProSettings(host="10.1.1.1", port=9000))
+
+        settings.save(settings_path)
+
+        assert json.loads(settings_path.read_text()) == settings.to_dict()
+
     def test_save_with_custom_path(self, tmp_path: Path) -> None:
         """Test saving to a custom path."""
         custom_path = tmp_path / "custom_settings.json"
@@ -307,6 +392,92 @@ class TestSettingsSave:
         data = json.loads(custom_path.read_text())
         assert data["gspro"]["host"] == "custom.save"
 
+    def test_batched_saves_share_one_fsync(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a burst of saves is fsynced once, when flushed."""
+        settings_path = tmp_path / "settings.json"
+        Settings.flush_pending()  # Drop syncs queued by earlier tests
+        fsyncs: list[int] = []
+        monkeypatch.setattr(settings_module, "SAVE_SYNC_DELAY_S", 60.0)
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+
+        for port in range(1, 101):
+            Settings(gspro=GSProSettings(port=port)).save(settings_path)
+
+        # Content is in place immediately; only the fsync is deferred
+        assert json.loads(settings_path.read_text())["gspro"]["port"] == 100
+        assert fsyncs == []
+
+        Settings.flush_pending()
+
+        # One fsync for the file plus one for its directory where supported
+        assert len(fsyncs) == (2 if hasattr(os, "O_DIRECTORY") else 1)
+
+    def test_save_sync_now_fsyncs_before_returning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that sync="now" fsyncs without waiting for a flush."""
+        settings_path = tmp_path / "settings.json"
+        fsyncs: list[int] = []
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+
+        Settings().save(settings_path, sync="now")
+
+        assert fsyncs
+        assert list(tmp_path.iterdir()) == [settings_path]
+
+    def test_failed_save_leaves_previous_file_intact(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a save interrupted before the swap keeps the old file."""
+        settings_path = tmp_path / "settings.json"
+        Settings(gspro=GSProSettings(host="before")).save(settings_path)
+
+        def crash(*_args: object) -> None:
+            raise OSError("simulated crash")
+
+        monkeypatch.setattr(os, "replace", crash)
+        with pytest.raises(OSError, match="simulated crash"):
+            Settings(gspro=GSProSettings(host="after")).save(settings_path)
+
+        assert json.loads(settings_path.read_text())["gspro"]["host"] == "before"
+        assert list(tmp_path.iterdir()) == [settings_path]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_save_keeps_file_permissions(self, tmp_path: Path) -> None:
+        """Test that saves honour the umask and keep an existing file's mode."""
+        settings_path = tmp_path / "settings.json"
+        umask = os.umask(0)
+        os.umask(umask)
+
+        Settings().save(settings_path)
+        assert settings_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+        settings_path.chmod(0o640)
+        Settings().save(settings_path)
+        assert settings_path.stat().st_mode & 0o777 == 0o640
+
+    def test_batched_fsync_opens_file_writable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the deferred fsync uses a descriptor Windows can flush."""
+        settings_path = tmp_path / "settings.json"
+        Settings.flush_pending()
+        Settings().save(settings_path)
+
+        opened: dict[str, int] = {}
+        real_open = os.open
+
+        def recording_open(path: str | Path, flags: int, *args: int) -> int:
+            opened[str(path)] = flags
+            return real_open(path, flags, *args)
+
+        monkeypatch.setattr(os, "open", recording_open)
+        Settings.flush_pending()
+
+        assert opened[str(settings_path)] & os.O_RDWR
+
 
 class TestSettingsRoundtrip:
     """Tests for save then load roundtrip."""
@@ -382,3 +553,24 @@ class TestSettingsToDict:
         assert result["gspro"]["port"] == 1000
         assert result["gc2"]["use_mock"] is True
         assert result["ui"]["theme"] == "light"
+
+
+class TestConfigPackageImport:
+    """Tests for lazy loading of the settings models."""
+
+    def test_package_import_defers_pydantic(self) -> None:
+        """Test that importing gc2_connect.config loads pydantic only on demand."""
+        script = (
+            "import sys\n"
+            "import gc2_connect.config as config\n"
+            "config.get_settings_path()\n"
+            "assert 'pydantic' not in sys.modules, 'pydantic imported eagerly'\n"
+            "assert config.Settings().version == 2\n"
+            "assert 'pydantic' in sys.modules\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=False
+        )
+
+        assert result.returncode == 0, result.stderr
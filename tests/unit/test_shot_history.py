@@ -24,9 +24,9 @@ def small_manager() -> ShotHistoryManager:
     return ShotHistoryManager(limit=5)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_shot() -> GC2ShotData:
-    """Create a sample shot for testing."""
+    """Create a sample shot for testing, shared across the module (don't mutate)."""
     return GC2ShotData(
         shot_id=1,
         timestamp=datetime.now(),
@@ -39,25 +39,23 @@ def sample_shot() -> GC2ShotData:
     )
 
 
-@pytest.fixture
-def sample_shots() -> list[GC2ShotData]:
-    """Create a list of sample shots for testing."""
+@pytest.fixture(scope="module")
+def sample_shots() -> tuple[GC2ShotData, ...]:
+    """Create sample shots for testing, shared across the module (don't mutate)."""
     base_time = datetime.now()
-    shots = []
-    for i in range(10):
-        shots.append(
-            GC2ShotData(
-                shot_id=i + 1,
-                timestamp=base_time + timedelta(seconds=i),
-                ball_speed=140.0 + i * 2,  # 140-158 mph
-                launch_angle=10.0 + i * 0.5,  # 10-14.5 degrees
-                horizontal_launch_angle=float(i % 3 - 1),  # -1, 0, 1
-                total_spin=2500.0 + i * 100,  # 2500-3400 rpm
-                back_spin=2400.0 + i * 90,  # 2400-3210 rpm
-                side_spin=-200.0 + i * 40,  # -200 to 160 rpm
-            )
+    return tuple(
+        GC2ShotData(
+            shot_id=i + 1,
+            timestamp=base_time + timedelta(seconds=i),
+            ball_speed=140.0 + i * 2,  # 140-158 mph
+            launch_angle=10.0 + i * 0.5,  # 10-14.5 degrees
+            horizontal_launch_angle=float(i % 3 - 1),  # -1, 0, 1
+            total_spin=2500.0 + i * 100,  # 2500-3400 rpm
+            back_spin=2400.0 + i * 90,  # 2400-3210 rpm
+            side_spin=-200.0 + i * 40,  # -200 to 160 rpm
         )
-    return shots
+        for i in range(10)
+    )
 
 
 class TestShotHistoryManagerInit:
@@ -101,7 +99,7 @@ class TestShotHistoryManagerAddShot:
         assert manager.shots[0] == sample_shot
 
     def test_newest_shot_is_first(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test that newest shot is at index 0 (newest first ordering)."""
         for shot in sample_shots:
@@ -116,7 +114,7 @@ class TestShotHistoryManagerLimit:
     """Tests for history limit enforcement."""
 
     def test_respects_limit(
-        self, small_manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test that history respects the limit."""
         # Add 10 shots to manager with limit of 5
@@ -127,7 +125,7 @@ class TestShotHistoryManagerLimit:
         assert len(small_manager.shots) == 5
 
     def test_oldest_removed_when_over_limit(
-        self, small_manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test that oldest shots are removed when over limit."""
         for shot in sample_shots:
@@ -139,7 +137,7 @@ class TestShotHistoryManagerLimit:
         assert 10 in shot_ids
 
     def test_update_limit_trims_history(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test that updating limit trims existing history."""
         for shot in sample_shots:
@@ -151,6 +149,42 @@ class TestShotHistoryManagerLimit:
         assert manager.count == 3
         assert manager.shots[0].shot_id == 10  # Newest kept
 
+    def test_raising_limit_keeps_history_and_allows_growth(
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
+    ) -> None:
+        """Test that raising the limit keeps existing shots and lets more in."""
+        for shot in sample_shots[:5]:
+            small_manager.add_shot(shot)
+
+        small_manager.limit = 8
+        for shot in sample_shots[5:]:
+            small_manager.add_shot(shot)
+
+        assert [s.shot_id for s in small_manager.shots] == [10, 9, 8, 7, 6, 5, 4, 3]
+
+    def test_negative_limit_is_treated_as_zero(
+        self, small_manager: ShotHistoryManager, sample_shot: GC2ShotData
+    ) -> None:
+        """Test that a negative limit keeps nothing instead of failing."""
+        small_manager.add_shot(sample_shot)
+
+        small_manager.limit = -1
+        small_manager.add_shot(sample_shot)
+
+        assert small_manager.limit == 0
+        assert small_manager.count == 0
+        assert ShotHistoryManager(limit=-5).limit == 0
+
+    def test_shots_is_a_snapshot(
+        self, manager: ShotHistoryManager, sample_shot: GC2ShotData
+    ) -> None:
+        """Test that modifying the returned list does not change the history."""
+        manager.add_shot(sample_shot)
+
+        manager.shots.clear()
+
+        assert manager.count == 1
+
     def test_can_handle_100_plus_shots(self, manager: ShotHistoryManager) -> None:
         """Test that manager handles 100+ shots efficiently."""
         manager.limit = 150
@@ -176,7 +210,7 @@ class TestShotHistoryManagerClear:
     """Tests for clearing history."""
 
     def test_clear_removes_all_shots(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test that clear removes all shots."""
         for shot in sample_shots:
@@ -211,7 +245,7 @@ class TestShotHistoryManagerStatistics:
         assert stats["avg_total_spin"] == 2800.0
 
     def test_stats_averages_correctly(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test statistics averages are calculated correctly."""
         for shot in sample_shots:
@@ -229,7 +263,7 @@ class TestShotHistoryManagerStatistics:
         assert stats["avg_total_spin"] == pytest.approx(2950.0, abs=0.1)
 
     def test_stats_includes_max_values(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test statistics include max values."""
         for shot in sample_shots:
@@ -240,6 +274,42 @@ class TestShotHistoryManagerStatistics:
         assert stats["max_ball_speed"] == 158.0
         assert stats["max_total_spin"] == 3400.0
 
+    def test_stats_track_evictions(
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
+    ) -> None:
+        """Test statistics match a full rescan as old shots are evicted."""
+        # Descending speeds so each eviction drops the current max
+        for shot in reversed(sample_shots):
+            small_manager.add_shot(shot)
+            stats = small_manager.get_statistics()
+            kept = small_manager.shots
+
+            assert stats["count"] == len(kept)
+            assert stats["avg_ball_speed"] == pytest.approx(
+                sum(s.ball_speed for s in kept) / len(kept), abs=1e-9
+            )
+            assert stats["avg_launch_angle"] == pytest.approx(
+                sum(s.launch_angle for s in kept) / len(kept), abs=1e-9
+            )
+            assert stats["avg_total_spin"] == pytest.approx(
+                sum(s.total_spin for s in kept) / len(kept), abs=1e-9
+            )
+            assert stats["max_ball_speed"] == max(s.ball_speed for s in kept)
+            assert stats["max_total_spin"] == max(s.total_spin for s in kept)
+
+    def test_stats_reset_after_clear(
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
+    ) -> None:
+        """Test that clearing resets the running totals."""
+        for shot in sample_shots:
+            manager.add_shot(shot)
+        manager.clear()
+        manager.add_shot(sample_shots[0])
+
+        stats = manager.get_statistics()
+        assert stats["avg_ball_speed"] == 140.0
+        assert stats["max_total_spin"] == 2500.0
+
 
 class TestShotHistoryManagerExport:
     """Tests for exporting shots."""
@@ -308,6 +378,26 @@ class TestShotHistoryManagerExport:
         assert shot_dict["face_to_target"] == 1.0
         assert shot_dict["angle_of_attack"] == -3.5
 
+    def test_to_dict_list_tracks_history_changes(
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
+    ) -> None:
+        """Test repeated exports follow adds, evictions and caller edits."""
+        for shot in sample_shots[:3]:
+            small_manager.add_shot(shot)
+        first = small_manager.to_dict_list()
+        first[0]["ball_speed"] = -1.0
+        assert small_manager.to_dict_list()[0]["ball_speed"] == sample_shots[2].ball_speed
+
+        for shot in sample_shots[3:]:
+            small_manager.add_shot(shot)
+        second = small_manager.to_dict_list()
+
+        assert [row["shot_id"] for row in first] == [3, 2, 1]
+        assert [row["shot_id"] for row in second] == [10, 9, 8, 7, 6]
+        assert small_manager.to_dict_list() == second
+        small_manager.limit = 2
+        assert [row["shot_id"] for row in small_manager.to_dict_list()] == [10, 9]
+
 
 class TestShotHistoryManagerFormatting:
     """Tests for formatted output."""
@@ -317,7 +407,7 @@ class TestShotHistoryManagerFormatting:
         assert manager.format_count_display() == "Shots: 0/50"
 
     def test_format_count_display_with_shots(
-        self, manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test count display with shots."""
         for shot in sample_shots:
@@ -326,10 +416,25 @@ class TestShotHistoryManagerFormatting:
         assert manager.format_count_display() == "Shots: 10/50"
 
     def test_format_count_display_at_limit(
-        self, small_manager: ShotHistoryManager, sample_shots: list[GC2ShotData]
+        self, small_manager: ShotHistoryManager, sample_shots: tuple[GC2ShotData, ...]
     ) -> None:
         """Test count display when at limit."""
         for shot in sample_shots:
             small_manager.add_shot(shot)
 
         assert small_manager.format_count_display() == "Shots: 5/5"
+
+    def test_format_count_display_follows_changes(
+        self, manager: ShotHistoryManager, sample_shot: GC2ShotData
+    ) -> None:
+        """Test count display updates after adds, limit changes and clear."""
+        assert manager.format_count_display() == "Shots: 0/50"
+
+        manager.add_shot(sample_shot)
+        assert manager.format_count_display() == "Shots: 1/50"
+
+        manager.limit = 10
+        assert manager.format_count_display() == "Shots: 1/10"
+
+        manager.clear()
+        assert manager.format_count_display() == "Shots: 0/10"
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
 
 import pytest
 
@@ -12,15 +12,52 @@ from gc2_connect.models import GC2ShotData
 from gc2_connect.services.shot_router import AppMode, ShotRouter
 
 
+class Recorder:
+    """Async callback that records the argument of each await."""
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+
+    async def __call__(self, arg: Any) -> None:
+        self.calls.append(arg)
+
+
+class GSProClientStub:
+    """Stand-in GSPro client that records sent shots and disconnects."""
+
+    def __init__(self) -> None:
+        self.sent: list[GC2ShotData] = []
+        self.disconnect_count = 0
+        self.is_connected = True
+
+    async def send_shot_async(self, shot: GC2ShotData) -> None:
+        self.sent.append(shot)
+
+    def disconnect(self) -> None:
+        self.disconnect_count += 1
+
+
+class EngineStub:
+    """Stand-in Open Range engine returning a fixed result."""
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = result
+        self.calls: list[GC2ShotData] = []
+
+    def simulate_shot(self, shot: GC2ShotData) -> Any:
+        self.calls.append(shot)
+        return self.result
+
+
 @pytest.fixture
 def shot_router() -> ShotRouter:
     """Create a ShotRouter instance for testing."""
     return ShotRouter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_shot() -> GC2ShotData:
-    """Create a sample shot for testing."""
+    """Create a sample shot for testing, shared across the module (don't mutate)."""
     return GC2ShotData(
         shot_id=1,
         ball_speed=145.0,
@@ -52,156 +89,114 @@ class TestAppModeEnum:
 class TestShotRouterInitialization:
     """Tests for ShotRouter initialization."""
 
-    def test_default_mode_is_gspro(self, shot_router: ShotRouter) -> None:
-        """Test that default mode is GSPro."""
-        assert shot_router.mode == AppMode.GSPRO
-
-    def test_gspro_client_initially_none(self, shot_router: ShotRouter) -> None:
-        """Test that GSPro client is initially not set."""
-        assert shot_router._gspro_client is None
-
-    def test_open_range_engine_initially_none(self, shot_router: ShotRouter) -> None:
-        """Test that Open Range engine is initially not set."""
-        assert shot_router._open_range_engine is None
-
-    def test_callbacks_initially_none(self, shot_router: ShotRouter) -> None:
-        """Test that callbacks are initially not set."""
-        assert shot_router._mode_change_callback is None
-        assert shot_router._shot_result_callback is None
+    def test_initial_state(self, shot_router: ShotRouter) -> None:
+        """Test that a new router is in GSPro mode with nothing configured."""
+        assert (
+            shot_router.mode,
+            shot_router._gspro_client,
+            shot_router._open_range_engine,
+            shot_router._mode_change_callback,
+            shot_router._shot_result_callback,
+        ) == (AppMode.GSPRO, None, None, None, None)
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestModeSwitching:
     """Tests for mode switching functionality."""
 
-    @pytest.mark.asyncio
-    async def test_set_mode_to_open_range(self, shot_router: ShotRouter) -> None:
-        """Test switching mode to Open Range."""
-        await shot_router.set_mode(AppMode.OPEN_RANGE)
-        assert shot_router.mode == AppMode.OPEN_RANGE
-
-    @pytest.mark.asyncio
-    async def test_set_mode_to_gspro(self, shot_router: ShotRouter) -> None:
-        """Test switching mode to GSPro."""
-        # First switch to open range
-        await shot_router.set_mode(AppMode.OPEN_RANGE)
-        # Then switch back to GSPro
-        await shot_router.set_mode(AppMode.GSPRO)
-        assert shot_router.mode == AppMode.GSPRO
-
-    @pytest.mark.asyncio
-    async def test_set_same_mode_is_noop(self, shot_router: ShotRouter) -> None:
-        """Test that setting the same mode doesn't trigger callback."""
-        callback = AsyncMock()
-        shot_router.on_mode_change(callback)
-
-        # Set to same mode
-        await shot_router.set_mode(AppMode.GSPRO)
-
-        # Callback should not be called
-        callback.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_mode_change_callback_invoked(self, shot_router: ShotRouter) -> None:
-        """Test that mode change callback is invoked on mode switch."""
-        callback = AsyncMock()
-        shot_router.on_mode_change(callback)
-
-        await shot_router.set_mode(AppMode.OPEN_RANGE)
-
-        callback.assert_called_once_with(AppMode.OPEN_RANGE)
-
-    @pytest.mark.asyncio
-    async def test_mode_change_callback_with_both_directions(self, shot_router: ShotRouter) -> None:
-        """Test callback is invoked when switching in both directions."""
-        callback = AsyncMock()
+    @pytest.mark.parametrize(
+        ("sequence", "final", "notified"),
+        [
+            ([AppMode.OPEN_RANGE], AppMode.OPEN_RANGE, [AppMode.OPEN_RANGE]),
+            (
+                [AppMode.OPEN_RANGE, AppMode.GSPRO],
+                AppMode.GSPRO,
+                [AppMode.OPEN_RANGE, AppMode.GSPRO],
+            ),
+            ([AppMode.GSPRO], AppMode.GSPRO, []),
+            ([AppMode.OPEN_RANGE, AppMode.OPEN_RANGE], AppMode.OPEN_RANGE, [AppMode.OPEN_RANGE]),
+        ],
+        ids=["to_open_range", "back_to_gspro", "same_mode_is_noop", "repeat_is_noop"],
+    )
+    async def test_set_mode_sequence(
+        self,
+        shot_router: ShotRouter,
+        sequence: list[AppMode],
+        final: AppMode,
+        notified: list[AppMode],
+    ) -> None:
+        """Test the final mode and callbacks after a sequence of mode switches."""
+        callback = Recorder()
         shot_router.on_mode_change(callback)
 
-        await shot_router.set_mode(AppMode.OPEN_RANGE)
-        await shot_router.set_mode(AppMode.GSPRO)
+        for mode in sequence:
+            await shot_router.set_mode(mode)
 
-        assert callback.call_count == 2
-        callback.assert_any_call(AppMode.OPEN_RANGE)
-        callback.assert_any_call(AppMode.GSPRO)
+        assert shot_router.mode == final
+        assert callback.calls == notified
 
 
 class TestClientConfiguration:
     """Tests for configuring clients/engines."""
 
-    def test_set_gspro_client(self, shot_router: ShotRouter) -> None:
-        """Test setting GSPro client."""
-        mock_client = MagicMock()
-        shot_router.set_gspro_client(mock_client)
-        assert shot_router._gspro_client is mock_client
-
-    def test_set_open_range_engine(self, shot_router: ShotRouter) -> None:
-        """Test setting Open Range engine."""
-        mock_engine = MagicMock()
-        shot_router.set_open_range_engine(mock_engine)
-        assert shot_router._open_range_engine is mock_engine
-
-    def test_on_mode_change_registers_callback(self, shot_router: ShotRouter) -> None:
-        """Test registering mode change callback."""
-        callback = AsyncMock()
-        shot_router.on_mode_change(callback)
-        assert shot_router._mode_change_callback is callback
-
-    def test_on_shot_result_registers_callback(self, shot_router: ShotRouter) -> None:
-        """Test registering shot result callback."""
-        callback = AsyncMock()
-        shot_router.on_shot_result(callback)
-        assert shot_router._shot_result_callback is callback
+    @pytest.mark.parametrize(
+        ("setter", "attr"),
+        [
+            ("set_gspro_client", "_gspro_client"),
+            ("set_open_range_engine", "_open_range_engine"),
+            ("on_mode_change", "_mode_change_callback"),
+            ("on_shot_result", "_shot_result_callback"),
+        ],
+    )
+    def test_setter_stores_object(self, shot_router: ShotRouter, setter: str, attr: str) -> None:
+        """Test that each client, engine and callback setter stores what it is given."""
+        obj = object()
+        getattr(shot_router, setter)(obj)
+        assert getattr(shot_router, attr) is obj
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestShotRouting:
     """Tests for shot routing functionality."""
 
-    @pytest.mark.asyncio
     async def test_route_shot_gspro_mode_calls_gspro(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that shots are routed to GSPro in GSPRO mode."""
-        mock_client = MagicMock()
-        mock_client.send_shot_async = AsyncMock()
-        shot_router.set_gspro_client(mock_client)
+        client = GSProClientStub()
+        shot_router.set_gspro_client(client)  # type: ignore[arg-type]
 
         await shot_router.route_shot(sample_shot)
 
-        mock_client.send_shot_async.assert_called_once_with(sample_shot)
+        assert client.sent == [sample_shot]
 
-    @pytest.mark.asyncio
     async def test_route_shot_open_range_mode_calls_engine(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that shots are routed to Open Range in OPEN_RANGE mode."""
-        mock_engine = MagicMock()
-        mock_result = MagicMock()
-        mock_engine.simulate_shot.return_value = mock_result
-        shot_router.set_open_range_engine(mock_engine)
+        engine = EngineStub()
+        shot_router.set_open_range_engine(engine)  # type: ignore[arg-type]
 
         await shot_router.set_mode(AppMode.OPEN_RANGE)
         await shot_router.route_shot(sample_shot)
 
-        mock_engine.simulate_shot.assert_called_once_with(sample_shot)
+        assert engine.calls == [sample_shot]
 
-    @pytest.mark.asyncio
     async def test_route_shot_open_range_invokes_result_callback(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that shot result callback is invoked in Open Range mode."""
-        mock_engine = MagicMock()
-        mock_result = MagicMock()
-        mock_engine.simulate_shot.return_value = mock_result
-        shot_router.set_open_range_engine(mock_engine)
+        result = object()
+        shot_router.set_open_range_engine(EngineStub(result))  # type: ignore[arg-type]
 
-        result_callback = AsyncMock()
+        result_callback = Recorder()
         shot_router.on_shot_result(result_callback)
 
         await shot_router.set_mode(AppMode.OPEN_RANGE)
         await shot_router.route_shot(sample_shot)
 
-        result_callback.assert_called_once_with(mock_result)
+        assert result_callback.calls == [result]
 
-    @pytest.mark.asyncio
     async def test_route_shot_gspro_no_client_raises(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
@@ -209,7 +204,6 @@ class TestShotRouting:
         with pytest.raises(RuntimeError, match="GSPro client not configured"):
             await shot_router.route_shot(sample_shot)
 
-    @pytest.mark.asyncio
     async def test_route_shot_open_range_no_engine_raises(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
@@ -219,27 +213,24 @@ class TestShotRouting:
             await shot_router.route_shot(sample_shot)
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestGracefulModeTransitions:
     """Tests for graceful mode transitions."""
 
-    @pytest.mark.asyncio
     async def test_gspro_connection_maintained_on_mode_switch(
         self, shot_router: ShotRouter
     ) -> None:
         """Test that GSPro connection stays open when switching to Open Range."""
-        mock_client = MagicMock()
-        mock_client.disconnect = MagicMock()
-        mock_client.is_connected = True
-        shot_router.set_gspro_client(mock_client)
+        client = GSProClientStub()
+        shot_router.set_gspro_client(client)  # type: ignore[arg-type]
 
         await shot_router.set_mode(AppMode.OPEN_RANGE)
 
         # GSPro client should NOT be disconnected
-        mock_client.disconnect.assert_not_called()
+        assert client.disconnect_count == 0
         # Client should still be accessible
-        assert shot_router._gspro_client is mock_client
+        assert shot_router._gspro_client is client
 
-    @pytest.mark.asyncio
     async def test_mode_switch_is_graceful_without_errors(self, shot_router: ShotRouter) -> None:
         """Test that mode switching doesn't raise errors."""
         # Switch multiple times - should not raise
@@ -250,54 +241,46 @@ class TestGracefulModeTransitions:
 
         assert shot_router.mode == AppMode.GSPRO
 
-    @pytest.mark.asyncio
     async def test_open_range_works_without_gspro_connection(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that Open Range works even without GSPro client configured."""
-        mock_engine = MagicMock()
-        mock_result = MagicMock()
-        mock_engine.simulate_shot.return_value = mock_result
-        shot_router.set_open_range_engine(mock_engine)
+        engine = EngineStub()
+        shot_router.set_open_range_engine(engine)  # type: ignore[arg-type]
 
         # No GSPro client configured, but Open Range should still work
         await shot_router.set_mode(AppMode.OPEN_RANGE)
         await shot_router.route_shot(sample_shot)
 
-        mock_engine.simulate_shot.assert_called_once()
+        assert len(engine.calls) == 1
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestShotCallbacks:
     """Tests for shot-related callbacks."""
 
-    @pytest.mark.asyncio
     async def test_shot_result_callback_not_called_in_gspro_mode(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that shot result callback is not called in GSPro mode."""
-        mock_client = MagicMock()
-        mock_client.send_shot_async = AsyncMock()
-        shot_router.set_gspro_client(mock_client)
+        shot_router.set_gspro_client(GSProClientStub())  # type: ignore[arg-type]
 
-        result_callback = AsyncMock()
+        result_callback = Recorder()
         shot_router.on_shot_result(result_callback)
 
         await shot_router.route_shot(sample_shot)
 
-        result_callback.assert_not_called()
+        assert result_callback.calls == []
 
-    @pytest.mark.asyncio
     async def test_shot_result_callback_optional(
         self, shot_router: ShotRouter, sample_shot: GC2ShotData
     ) -> None:
         """Test that Open Range works without shot result callback."""
-        mock_engine = MagicMock()
-        mock_result = MagicMock()
-        mock_engine.simulate_shot.return_value = mock_result
-        shot_router.set_open_range_engine(mock_engine)
+        engine = EngineStub()
+        shot_router.set_open_range_engine(engine)  # type: ignore[arg-type]
 
         await shot_router.set_mode(AppMode.OPEN_RANGE)
         # No callback registered, should not raise
         await shot_router.route_shot(sample_shot)
 
-        mock_engine.simulate_shot.assert_called_once()
+        assert len(engine.calls) == 1
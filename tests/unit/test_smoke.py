@@ -1,45 +1,43 @@
 # ABOUTME: Smoke test to verify the test infrastructure works correctly.
 # ABOUTME: Includes basic import tests and fixture validation.
 
+import importlib
 from typing import Any
 
+import pytest
+
 from gc2_connect.models import GC2ShotData, GSProShotMessage
 
 
-def test_smoke_imports_work() -> None:
+@pytest.mark.parametrize(
+    "module", ["gc2_connect.models", "gc2_connect.gc2.usb_reader", "gc2_connect.gspro.client"]
+)
+def test_smoke_imports_work(module: str) -> None:
     """Verify that the main modules can be imported."""
-    from gc2_connect import models
-    from gc2_connect.gc2 import usb_reader
-    from gc2_connect.gspro import client
-
-    assert models is not None
-    assert usb_reader is not None
-    assert client is not None
-
-
-def test_gc2_shot_data_model_exists() -> None:
-    """Verify that GC2ShotData model is defined."""
-    assert GC2ShotData is not None
-    assert hasattr(GC2ShotData, "ball_speed")
-    assert hasattr(GC2ShotData, "from_gc2_dict")
+    importlib.import_module(module)
 
 
-def test_gspro_shot_message_model_exists() -> None:
-    """Verify that GSProShotMessage model is defined."""
-    assert GSProShotMessage is not None
-    assert hasattr(GSProShotMessage, "from_gc2_shot")
-    assert hasattr(GSProShotMessage, "to_dict")
+@pytest.mark.parametrize(
+    ("model", "attr"),
+    [
+        (GC2ShotData, "ball_speed"),
+        (GC2ShotData, "from_gc2_dict"),
+        (GSProShotMessage, "from_gc2_shot"),
+        (GSProShotMessage, "to_dict"),
+    ],
+)
+def test_models_define_expected_attributes(model: type, attr: str) -> None:
+    """Verify that the core models expose their main fields and constructors."""
+    assert hasattr(model, attr)
 
 
 def test_fixtures_load_correctly(valid_gc2_dict: dict[str, Any]) -> None:
     """Verify that fixtures from conftest.py are available."""
-    assert valid_gc2_dict is not None
     assert "SPEED_MPH" in valid_gc2_dict
     assert "SHOT_ID" in valid_gc2_dict
 
 
 def test_gc2_shot_fixture_creates_valid_shot(sample_gc2_shot: GC2ShotData) -> None:
     """Verify that sample_gc2_shot fixture creates a valid GC2ShotData."""
-    assert sample_gc2_shot is not None
     assert sample_gc2_shot.ball_speed > 0
     assert sample_gc2_shot.is_valid()
@@ -4,9 +4,142 @@
 """Mock GSPro server for testing without GSPro."""
 
 import argparse
+import asyncio
 import json
-import socket
-from datetime import datetime
+import re
+import time
+from typing import Any
+
+# Responses never vary, so encode them once
+_OK_RESPONSE = json.dumps(
+    {
+        "Code": 200,
+        "Message": "Shot received successfully",
+        "Player": {"Handed": "RH", "Club": "DR"},
+    }
+).encode("utf-8")
+_INVALID_JSON_RESPONSE = json.dumps({"Code": 500, "Message": "Invalid JSON"}).encode("utf-8")
+
+# Unfinished input beyond this is treated as garbage rather than awaited
+MAX_MESSAGE_BYTES = 1 << 20
+
+_CONTENT = re.compile(rb"[^ \t\r\n]")
+# The only bytes that matter when finding where a JSON object ends
+_STRUCTURE = re.compile(rb'[{}"\\]')
+
+
+def find_message_end(buffer: bytes | bytearray, start: int) -> int:
+    """Find the end of the JSON object that opens at buffer[start].
+
+    GSPro messages are bare JSON objects with nothing between them, and TCP
+    may split or merge them, so a message ends where its first brace closes.
+    Braces inside strings don't count.
+
+    Returns:
+        Index just past the closing brace, or -1 if the object is incomplete.
+    """
+    depth = 0
+    in_string = False
+    escaped = -1
+    for match in _STRUCTURE.finditer(buffer, start):
+        pos = match.start()
+        if pos == escaped:
+            continue
+        char = match.group()
+        if in_string:
+            if char == b"\\":
+                escaped = pos + 1
+            elif char == b'"':
+                in_string = False
+        elif char == b'"':
+            in_string = True
+        elif char == b"{":
+            depth += 1
+        elif char == b"}":
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+    return -1
+
+
+def handle_message(raw: bytes | bytearray) -> bytes:
+    """Log one complete message and return the response to send."""
+    try:
+        # json.loads detects the encoding of bytes itself
+        message = json.loads(raw)
+    except ValueError:  # bad JSON, or bytes that aren't UTF-8/16/32
+        print(f"Invalid JSON received: {bytes(raw)!r}")
+        return _INVALID_JSON_RESPONSE
+    if not isinstance(message, dict):
+        print(f"Message is not a JSON object: {message!r}")
+        return _INVALID_JSON_RESPONSE
+
+    print_shot(message)
+    return _OK_RESPONSE
+
+
+def print_shot(message: dict[str, Any]) -> None:
+    """Pretty print a received shot message."""
+    timestamp = time.strftime("%H:%M:%S")
+    shot_num = message.get("ShotNumber", "?")
+
+    print(f"\n[{timestamp}] Shot #{shot_num} received:")
+
+    ball_data = message.get("BallData", {})
+    print(f"  Ball Speed: {ball_data.get('Speed', 0):.1f} mph")
+    print(f"  Launch: {ball_data.get('VLA', 0):.1f}° / {ball_data.get('HLA', 0):.1f}°")
+    print(f"  Total Spin: {ball_data.get('TotalSpin', 0):.0f} RPM")
+    print(f"  Spin Axis: {ball_data.get('SpinAxis', 0):.1f}°")
+
+    club_data = message.get("ClubData", {})
+    if message.get("ShotDataOptions", {}).get("ContainsClubData"):
+        print(f"  Club Speed: {club_data.get('Speed', 0):.1f} mph")
+        print(f"  Path: {club_data.get('Path', 0):.1f}°")
+        print(f"  Face: {club_data.get('FaceToTarget', 0):.1f}°")
+
+
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Log shots from one client and answer each with a response."""
+    print(f"\nClient connected from {writer.get_extra_info('peername')}")
+
+    buffer = bytearray()
+    try:
+        while data := await reader.read(65536):
+            buffer += data
+            start = 0
+            while content := _CONTENT.search(buffer, start):
+                start = content.start()
+                if buffer[start] == ord("{"):
+                    end = find_message_end(buffer, start)
+                    if end < 0 and len(buffer) - start <= MAX_MESSAGE_BYTES:
+                        break  # the rest of this message hasn't arrived yet
+                else:
+                    end = -1
+                if end < 0:
+                    # Not a JSON object, or never finished: answer and drop it all
+                    end = len(buffer)
+                writer.write(handle_message(buffer[start:end]))
+                start = end
+            else:
+                start = len(buffer)  # nothing but whitespace left
+            del buffer[:start]
+            await writer.drain()
+
+        print("Client disconnected")
+    except ConnectionResetError:
+        print("Client connection reset")
+    finally:
+        writer.close()
+
+
+async def serve(host: str, port: int) -> None:
+    """Accept clients until cancelled, handling each concurrently."""
+    server = await asyncio.start_server(handle_client, host, port)
+
+    print("Waiting for connection...")
+
+    async with server:
+        await server.serve_forever()
 
 
 def run_server(host: str = "0.0.0.0", port: int = 921):
@@ -14,74 +147,10 @@ def run_server(host: str = "0.0.0.0", port: int = 921):
     print(f"Starting Mock GSPro Server on {host}:{port}")
     print("=" * 50)
 
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
-        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server.bind((host, port))
-        server.listen(1)
-
-        print("Waiting for connection...")
-
-        while True:
-            try:
-                conn, addr = server.accept()
-                print(f"\nClient connected from {addr}")
-
-                with conn:
-                    conn.settimeout(30.0)
-
-                    while True:
-                        try:
-                            data = conn.recv(4096)
-
-                            if not data:
-                                print("Client disconnected")
-                                break
-
-                            try:
-                                message = json.loads(data.decode("utf-8"))
-
-                                # Pretty print the received shot
-                                timestamp = datetime.now().strftime("%H:%M:%S")
-                                shot_num = message.get("ShotNumber", "?")
-
-                                print(f"\n[{timestamp}] Shot #{shot_num} received:")
-
-                                ball_data = message.get("BallData", {})
-                                print(f"  Ball Speed: {ball_data.get('Speed', 0):.1f} mph")
-                                print(
-                                    f"  Launch: {ball_data.get('VLA', 0):.1f}° / {ball_data.get('HLA', 0):.1f}°"
-                                )
-                                print(f"  Total Spin: {ball_data.get('TotalSpin', 0):.0f} RPM")
-                                print(f"  Spin Axis: {ball_data.get('SpinAxis', 0):.1f}°")
-
-                                club_data = message.get("ClubData", {})
-                                if message.get("ShotDataOptions", {}).get("ContainsClubData"):
-                                    print(f"  Club Speed: {club_data.get('Speed', 0):.1f} mph")
-                                    print(f"  Path: {club_data.get('Path', 0):.1f}°")
-                                    print(f"  Face: {club_data.get('FaceToTarget', 0):.1f}°")
-
-                                # Send success response
-                                response = {
-                                    "Code": 200,
-                                    "Message": "Shot received successfully",
-                                    "Player": {"Handed": "RH", "Club": "DR"},
-                                }
-
-                            except json.JSONDecodeError:
-                                print(f"Invalid JSON received: {data}")
-                                response = {"Code": 500, "Message": "Invalid JSON"}
-
-                            conn.sendall(json.dumps(response).encode("utf-8"))
-
-                        except TimeoutError:
-                            continue
-                        except ConnectionResetError:
-                            print("Client connection reset")
-                            break
-
-            except KeyboardInterrupt:
-                print("\nShutting down...")
-                break
+    try:
+        asyncio.run(serve(host, port))
+    except KeyboardInterrupt:
+        print("\nShutting down...")
 
 
 def main():